@@ -12,7 +12,7 @@ from typing import Any
 from functools import lru_cache
 
 import nested_admin
-from django.db.models import IntegerField, Subquery, OuterRef
+from nested_admin.formsets import NestedInlineFormSet
 from django.db.models.functions import Coalesce
 from django import forms
 from django.conf import settings
@@ -22,13 +22,8 @@ from django.contrib.admin.sites import NotRegistered
 from django.core.management import call_command
 from django.db.models import (
     Count,
-    F,
-    IntegerField,
-    OuterRef,
     Q,
-    Subquery,
     Sum,
-    Value,
 )
 from django.db import transaction  # noqa: F401  # kept if used by other modules via import side-effects
 from django.db.models.functions import Coalesce
@@ -54,6 +49,8 @@ from .models import (
     Tournament,
 
 )
+from .models.core import stored_file_url
+from .models.events import event_validation_cache
 from .models.games import GameNomination, LineSlot, Game as GameModel, GameCompetition
 from .models.stats_proxy import PlayerSeasonTotals
 from powerplay_app.services.stats import recompute_game
@@ -138,14 +135,16 @@ class StadiumAdmin(admin.ModelAdmin):
     fields = ("name", "address", "map_url", "photo", "photo_preview")
 
     def photo_thumb(self, obj):
-        if getattr(obj, "photo", None):
-            return format_html('<img src="{}" style="height:40px;border-radius:4px;" />', obj.photo.url)
+        url = stored_file_url(obj, "photo")
+        if url:
+            return format_html('<img src="{}" style="height:40px;border-radius:4px;" />', url)
         return "—"
     photo_thumb.short_description = "Foto"
 
     def photo_preview(self, obj):
-        if getattr(obj, "photo", None):
-            return format_html('<img src="{}" style="max-height:240px;border-radius:8px;" />', obj.photo.url)
+        url = stored_file_url(obj, "photo")
+        if url:
+            return format_html('<img src="{}" style="max-height:240px;border-radius:8px;" />', url)
         return "—"
     photo_preview.short_description = "Náhled"
 
@@ -183,10 +182,9 @@ class StaffInline(admin.TabularInline):
 
     def photo_preview(self, obj: Staff) -> str:
         """Render a small thumbnail preview for staff photo in admin."""
-        if obj and getattr(obj, "photo", None):
-            return format_html(
-                '<img src="{}" style="height:40px;border-radius:4px;" />', obj.photo.url
-            )
+        url = stored_file_url(obj, "photo") if obj else ""
+        if url:
+            return format_html('<img src="{}" style="height:40px;border-radius:4px;" />', url)
         return "—"
 
     photo_preview.short_description = "Náhled"
@@ -357,7 +355,7 @@ class LineForm(forms.ModelForm):
         }
 
 
-SKATER_ORDER = [LineSlot.LW, LineSlot.C, LineSlot.RW, LineSlot.LD, LineSlot.RD]
+SKATER_ORDER = (LineSlot.LW, LineSlot.C, LineSlot.RW, LineSlot.LD, LineSlot.RD)
 SKATER_LABELS = {
     LineSlot.LW: "Levé křídlo",
     LineSlot.C: "Střed",
@@ -391,19 +389,11 @@ class LineAssignmentInlineFormSet(BaseInlineFormSet):
             base_qs = Player.objects.none()
 
         if getattr(line, "line_number", None) == 0:
-            goalie_code = getattr(getattr(Player, "Position", None), "GOALIE", None)
-            goalie_filter = {"position": goalie_code} if goalie_code is not None else {
-                "position__in": ["goalie", "G", "GK", "GOALIE"]
-            }
-            qs = base_qs.filter(**goalie_filter)
+            qs = base_qs.filter(position=Player.Position.GOALIE)
             self.max_num = 1
             self.extra = max(0, 1 - self.initial_form_count())
         else:
-            goalie_code = getattr(getattr(Player, "Position", None), "GOALIE", None)
-            not_goalie_filter = ~Q(position=goalie_code) if goalie_code is not None else ~Q(
-                position__in=["goalie", "G", "GK", "GOALIE"]
-            )
-            qs = base_qs.filter(not_goalie_filter)
+            qs = base_qs.exclude(position=Player.Position.GOALIE)
             self.max_num = 5
             self.extra = max(0, 5 - self.initial_form_count())
 
@@ -419,9 +409,8 @@ class LineAssignmentInlineFormSet(BaseInlineFormSet):
         if is_goalie_line:
             slot_value = LineSlot.G
         else:
-            slot_order = [LineSlot.LW, LineSlot.C, LineSlot.RW, LineSlot.LD, LineSlot.RD]
             slot_value = (
-                slot_order[index] if isinstance(index, int) and 0 <= index < len(slot_order) else slot_order[-1]
+                SKATER_ORDER[index] if isinstance(index, int) and 0 <= index < len(SKATER_ORDER) else SKATER_ORDER[-1]
             )
 
         form.fields["slot"] = forms.CharField(widget=forms.HiddenInput(), required=False)
@@ -430,13 +419,7 @@ class LineAssignmentInlineFormSet(BaseInlineFormSet):
 
         if not is_goalie_line and isinstance(index, int) and 0 <= index < 5:
             form.fields["slot_label"] = forms.CharField(label="Štítek slotu", required=False, disabled=True)
-            form.initial["slot_label"] = {
-                LineSlot.LW: "Levé křídlo",
-                LineSlot.C: "Střed",
-                LineSlot.RW: "Pravé křídlo",
-                LineSlot.LD: "Levá obrana",
-                LineSlot.RD: "Pravá obrana",
-            }[slot_value]
+            form.initial["slot_label"] = SKATER_LABELS[slot_value]
 
     def save(self, commit: bool = True):  # type: ignore[override]
         """Persist created/changed/deleted inline objects preserving slot order."""
@@ -446,7 +429,7 @@ class LineAssignmentInlineFormSet(BaseInlineFormSet):
 
         line = self.instance
         is_goalie_line = getattr(line, "line_number", None) == 0
-        order = [LineSlot.LW, LineSlot.C, LineSlot.RW, LineSlot.LD, LineSlot.RD]
+        order = SKATER_ORDER
 
         for idx, form in enumerate(self.forms):
             if not hasattr(form, "cleaned_data"):
@@ -546,6 +529,36 @@ class SkaterLineAssignmentInline(nested_admin.NestedTabularInline):
 # ------------------------------------------------------------
 # Nested inlines – Goalie (0) and Skater lines (1–3)
 # ------------------------------------------------------------
+class GameLineInlineFormSet(NestedInlineFormSet):
+    """Line formset rejecting one player submitted into several slots.
+
+    Each line's assignments are a separate nested formset, so the per-game
+    constraint on ``LineAssignment`` only sees rows already saved; two new rows
+    for the same player would otherwise fail on INSERT.
+    """
+
+    def clean(self) -> None:
+        super().clean()
+        seen: set[int] = set()
+        duplicates: list[Player] = []
+        for form in self.forms:
+            if self.can_delete and self._should_delete_form(form):
+                continue
+            for nested in getattr(form, "nested_formsets", ()):
+                if not nested.is_valid():
+                    continue
+                for nested_form in nested.forms:
+                    player = nested_form.cleaned_data.get("player")
+                    if not player or nested_form.cleaned_data.get("DELETE"):
+                        continue
+                    if player.pk in seen:
+                        duplicates.append(player)
+                    seen.add(player.pk)
+        if duplicates:
+            names = ", ".join(_player_plain_label(p) for p in duplicates)
+            raise forms.ValidationError(f"Hráč může být v zápase přiřazen jen do jedné lajny: {names}.")
+
+
 class BaseGameLineInline(nested_admin.NestedTabularInline):
     """Base inline for lines bound to one of the game teams.
 
@@ -554,6 +567,7 @@ class BaseGameLineInline(nested_admin.NestedTabularInline):
 
     model = Line
     form = LineForm
+    formset = GameLineInlineFormSet
     extra = 0
     show_change_link = True
     can_delete = True
@@ -874,7 +888,9 @@ class GameAdmin(nested_admin.NestedModelAdmin):
         """
         extra_context = extra_context or {}
         extra_context["extrahead"] = (extra_context.get("extrahead", "") or "") + css_inline
-        return super().changeform_view(request, object_id, form_url, extra_context=extra_context)
+        # Goal/penalty inline rows share one nomination lookup per game
+        with event_validation_cache():
+            return super().changeform_view(request, object_id, form_url, extra_context=extra_context)
 
     @staticmethod
     def _ensure_default_lines(game: Game) -> None:
@@ -1000,6 +1016,12 @@ class TournamentAdmin(admin.ModelAdmin):
     filter_horizontal = ("games",)
     search_fields = ("name",)
 
+    def formfield_for_manytomany(self, db_field: Any, request: Any, **kwargs: Any):
+        """Join both teams for the game choices, whose labels render team names."""
+        if db_field.name == "games":
+            kwargs["queryset"] = Game.objects.select_related("home_team", "away_team")
+        return super().formfield_for_manytomany(db_field, request, **kwargs)
+
 
 # ------------------------------------------------------------
 # TeamEvent
@@ -1105,9 +1127,8 @@ def _debug_print_lineups(game: Game) -> None:
 class PlayerSeasonTotalsAdmin(admin.ModelAdmin):
     """Proxy-based aggregated totals for players shown in list view.
 
-    Totals are computed via annotations to avoid row multiplication; GA values
-    are obtained using subqueries scoped to goalie line (line 0) assignments on
-    home/away sides.
+    Totals are computed via annotations to avoid row multiplication; see
+    :meth:`PlayerSeasonTotalsQuerySet.with_season_totals`.
     """
 
     list_display = (
@@ -1127,41 +1148,8 @@ class PlayerSeasonTotalsAdmin(admin.ModelAdmin):
     actions = ["debug_totals", "debug_ga"]
 
     def get_queryset(self, request):  # type: ignore[override]
-        """
-        Sezonní součty z PlayerStats + GP z GameNomination,
-        každé jako samostatný subdotaz → žádné násobení přes JOIN.
-        """
-        qs = super().get_queryset(request).select_related("team", "team__league")
-
-        gp_sq = (
-            GameNomination.objects
-            .filter(player=OuterRef("pk"))
-            .values("player")
-            .annotate(gp=Count("game", distinct=True))
-            .values("gp")[:1]
-        )
-
-        ps_sq = (
-            PlayerStats.objects
-            .filter(player=OuterRef("pk"))
-            .values("player")
-            .annotate(
-                g=Coalesce(Sum("goals"), 0),
-                a=Coalesce(Sum("assists"), 0),
-                pim=Coalesce(Sum("penalty_minutes"), 0),
-                ga=Coalesce(Sum("goals_against"), 0),
-            )
-        )
-
-        qs = qs.annotate(
-            games_played=Coalesce(Subquery(gp_sq, output_field=IntegerField()), Value(0)),
-            goals=Coalesce(Subquery(ps_sq.values("g")[:1], output_field=IntegerField()), Value(0)),
-            assists=Coalesce(Subquery(ps_sq.values("a")[:1], output_field=IntegerField()), Value(0)),
-            penalty_minutes=Coalesce(Subquery(ps_sq.values("pim")[:1], output_field=IntegerField()), Value(0)),
-            goals_against=Coalesce(Subquery(ps_sq.values("ga")[:1], output_field=IntegerField()), Value(0)),
-        ).annotate(points=F("goals") + F("assists"))
-
-        return qs
+        """Season totals aggregated in SQL by ``with_season_totals``."""
+        return super().get_queryset(request).select_related("team", "team__league").with_season_totals()
 
     # ---- list_display helpers ----
     @admin.display(ordering="last_name", description="Hráč")
@@ -1413,6 +1401,7 @@ class GameFeedbackAdmin(admin.ModelAdmin):
         "created_by_display",
     )
     list_filter = ("team", HasGameFilter)  # ← žádné 'status'
+    list_select_related = ("team", "related_game__home_team", "related_game__away_team", "created_by")
     search_fields = (
         "subject",
         "message",
@@ -1424,6 +1413,24 @@ class GameFeedbackAdmin(admin.ModelAdmin):
     date_hierarchy = "created_at"
     ordering = ("-created_at",)
 
+    def get_queryset(self, request: Any):  # type: ignore[override]
+        """Skip the message body when rendering the changelist page only.
+
+        The list does not show ``__str__`` (which falls back to the message),
+        but change/delete views and action confirmations (POST) do, so they
+        keep loading the full row.
+        """
+        qs = super().get_queryset(request)
+        match = getattr(request, "resolver_match", None)
+        opts = self.model._meta
+        if (
+            request.method == "GET"
+            and match is not None
+            and match.url_name == f"{opts.app_label}_{opts.model_name}_changelist"
+        ):
+            qs = qs.defer("message")
+        return qs
+
     @admin.display(description="Autor")
     def created_by_display(self, obj: GameFeedback) -> str:
         """Prefer stored author name; otherwise fall back to username."""
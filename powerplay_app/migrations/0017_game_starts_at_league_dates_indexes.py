@@ -0,0 +1,21 @@
+# Generated by Django 5.2.5 on 2026-10-16 11:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('powerplay_app', '0016_stadium_photo_team_public_email_team_website_url'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='game',
+            index=models.Index(fields=['starts_at'], name='powerplay_a_starts__7ff245_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='league',
+            index=models.Index(fields=['date_start', 'date_end'], name='powerplay_a_date_st_2b4113_idx'),
+        ),
+    ]
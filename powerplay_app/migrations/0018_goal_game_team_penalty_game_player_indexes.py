@@ -0,0 +1,21 @@
+# Generated by Django 5.2.5 on 2026-10-16 11:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('powerplay_app', '0017_game_starts_at_league_dates_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='goal',
+            index=models.Index(fields=['game', 'team'], name='powerplay_a_game_id_0f41e3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='penalty',
+            index=models.Index(fields=['game', 'penalized_player'], name='powerplay_a_game_id_75d9a9_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.5 on 2026-10-16 11:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('powerplay_app', '0018_goal_game_team_penalty_game_player_indexes'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='goal',
+            constraint=models.CheckConstraint(condition=models.Q(('assist_1', models.F('scorer')), _negated=True), name='goal_assist_1_not_scorer', violation_error_message='Asistent 1 nesmí být zároveň střelcem.'),
+        ),
+        migrations.AddConstraint(
+            model_name='goal',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('assist_2', models.F('scorer')), _negated=True), models.Q(('assist_2', models.F('assist_1')), _negated=True)), name='goal_assist_2_distinct', violation_error_message='Asistent 2 nesmí být střelcem ani shodný s Asistentem 1.'),
+        ),
+    ]
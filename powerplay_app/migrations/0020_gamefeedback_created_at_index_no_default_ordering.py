@@ -0,0 +1,23 @@
+# Generated by Django 5.2.5 on 2026-10-16 11:33
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('powerplay_app', '0019_goal_assist_check_constraints'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='gamefeedback',
+            options={'verbose_name': 'Připomínka', 'verbose_name_plural': 'Připomínky'},
+        ),
+        migrations.AddIndex(
+            model_name='gamefeedback',
+            index=models.Index(fields=['-created_at'], name='powerplay_a_created_f51296_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.5 on 2026-10-16 11:34
+
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_team_name(apps, schema_editor):
+    GameFeedback = apps.get_model("powerplay_app", "GameFeedback")
+    Team = apps.get_model("powerplay_app", "Team")
+    GameFeedback.objects.update(
+        team_name=Subquery(Team.objects.filter(pk=OuterRef("team_id")).values("name")[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('powerplay_app', '0020_gamefeedback_created_at_index_no_default_ordering'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='gamefeedback',
+            name='team_name',
+            field=models.CharField(blank=True, editable=False, max_length=255, verbose_name='Název týmu (snapshot)'),
+        ),
+        migrations.RunPython(backfill_team_name, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.5 on 2026-10-16 11:37
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Min, OuterRef, Subquery
+
+
+def backfill_game(apps, schema_editor):
+    LineAssignment = apps.get_model("powerplay_app", "LineAssignment")
+    Line = apps.get_model("powerplay_app", "Line")
+    LineAssignment.objects.update(
+        game_id=Subquery(Line.objects.filter(pk=OuterRef("line_id")).values("game_id")[:1])
+    )
+
+
+def clear_duplicate_players(apps, schema_editor):
+    # The old clean() check was racy: keep the first slot of a player listed
+    # twice in one game and empty the rest, so the unique constraint can be added.
+    LineAssignment = apps.get_model("powerplay_app", "LineAssignment")
+    assigned = LineAssignment.objects.filter(player__isnull=False)
+    first_ids = assigned.values("game_id", "player_id").annotate(first=Min("pk")).values("first")
+    cleared = assigned.exclude(pk__in=first_ids).update(player=None)
+    if cleared:
+        print(f"\n  Cleared {cleared} duplicate line assignment(s) of the same player in one game.")
+
+
+class Migration(migrations.Migration):
+    # NOT NULL and the unique constraint follow in 0026: on PostgreSQL the
+    # backfill queues deferred FK checks, and ALTER TABLE in the same
+    # transaction would fail with "pending trigger events".
+
+    dependencies = [
+        ('powerplay_app', '0021_gamefeedback_team_name'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='lineassignment',
+            name='game',
+            field=models.ForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='line_assignments', to='powerplay_app.game', verbose_name='Zápas'),
+        ),
+        migrations.RunPython(backfill_game, migrations.RunPython.noop),
+        migrations.RunPython(clear_duplicate_players, migrations.RunPython.noop),
+    ]
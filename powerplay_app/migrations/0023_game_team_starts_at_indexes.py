@@ -0,0 +1,21 @@
+# Generated by Django 5.2.5 on 2026-10-16 11:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('powerplay_app', '0022_lineassignment_game_unique_player'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='game',
+            index=models.Index(fields=['home_team', 'starts_at'], name='powerplay_a_home_te_23bb4c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='game',
+            index=models.Index(fields=['away_team', 'starts_at'], name='powerplay_a_away_te_f2c247_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.5 on 2026-10-16 11:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('powerplay_app', '0023_game_team_starts_at_indexes'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='teamevent',
+            constraint=models.CheckConstraint(condition=models.Q(('ends_at__gte', models.F('starts_at'))), name='teamevent_ends_not_before_start', violation_error_message='Konec události musí být po začátku.'),
+        ),
+    ]
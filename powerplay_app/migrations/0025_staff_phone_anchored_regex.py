@@ -0,0 +1,20 @@
+# Generated by Django 5.2.5 on 2026-10-16 11:44
+
+import django.core.validators
+import re
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('powerplay_app', '0024_teamevent_ends_not_before_start'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='staff',
+            name='phone',
+            field=models.CharField(blank=True, max_length=30, null=True, validators=[django.core.validators.RegexValidator(message='Zadej platné telefonní číslo (např. +420 123 456 789).', regex=re.compile('\\A\\+?[0-9\\- ]{7,20}\\Z'))], verbose_name='Telefon'),
+        ),
+    ]
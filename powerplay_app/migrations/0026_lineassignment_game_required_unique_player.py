@@ -0,0 +1,23 @@
+# Generated by Django 5.2.5 on 2026-10-16 14:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('powerplay_app', '0025_staff_phone_anchored_regex'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='lineassignment',
+            name='game',
+            field=models.ForeignKey(editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='line_assignments', to='powerplay_app.game', verbose_name='Zápas'),
+        ),
+        migrations.AddConstraint(
+            model_name='lineassignment',
+            constraint=models.UniqueConstraint(condition=models.Q(('player__isnull', False)), fields=('game', 'player'), name='uniq_lineassignment_game_player', violation_error_message='Hráč už je přiřazen v jiné lajně v tomto zápase.'),
+        ),
+    ]
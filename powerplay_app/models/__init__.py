@@ -1,6 +1,6 @@
 from .core import League, Stadium, Country, Team, Player
-from .games import Game, Line, LineSlot, LineAssignment,GameNomination
-from .events import Period, Strength, GameEventBase, Goal, Penalty
+from .games import Game, GameCompetition, Line, LineSlot, LineAssignment, GameNomination
+from .events import Period, Strength, PenaltyType, GameEventBase, Goal, Penalty
 from .stats import PlayerStats
 from .tournaments import Tournament
 from .staff import Staff
@@ -14,13 +14,13 @@ from powerplay_app.services.stats import recompute_game as _recompute_game
 
 __all__ = [
     "League", "Stadium", "Country", "Team", "Player",
-    "Game", "Line", "LineSlot", "LineAssignment",
-    "Period", "Strength", "GameEventBase", "Goal", "Penalty",
-    "PlayerStats", "Tournament",
+    "Game", "GameCompetition", "Line", "LineSlot", "LineAssignment", "GameNomination",
+    "Period", "Strength", "PenaltyType", "GameEventBase", "Goal", "Penalty",
+    "PlayerStats", "PlayerSeasonTotals", "Tournament",
     "Staff",
-    "_recompute_game",
-    "PlayerStats", "Tournament", "TeamEvent",
+    "TeamEvent",
     "WalletCategory", "WalletTransaction",
     "GameFeedback",
+    "_recompute_game",
 ]
 
@@ -22,6 +22,53 @@ from django.db import models
 from django.templatetags.static import static
 
 
+# --- Helpers ---------------------------------------------------------------
+
+
+def stored_file_name(instance: models.Model, attname: str) -> str:
+    """Return the stored name of a file/image field without wrapping it.
+
+    Accessing an ``ImageField`` attribute goes through the file descriptor,
+    which builds a ``FieldFile`` even for empty (NULL) columns. List pages only
+    need to know whether a file is present, so the raw value is read from the
+    instance ``__dict__`` first. Deferred fields fall back to the descriptor so
+    the column is still loaded on demand.
+
+    Args:
+        instance: Model instance holding the field.
+        attname: Attribute name of the file field (e.g. ``"photo"``).
+
+    Returns:
+        The stored relative path, or an empty string when no file is set.
+    """
+    if attname in instance.__dict__:
+        raw = instance.__dict__[attname]
+    else:
+        raw = getattr(instance, attname, None)
+    if raw is None or isinstance(raw, str):
+        return raw or ""
+    return getattr(raw, "name", None) or ""
+
+
+def stored_file_url(instance: models.Model, attname: str) -> str:
+    """Return the public URL of a file/image field straight from its storage.
+
+    Equivalent to ``instance.<attname>.url`` but skips building the
+    ``FieldFile`` wrapper, which matters on list pages rendering many rows.
+
+    Args:
+        instance: Model instance holding the field.
+        attname: Attribute name of the file field (e.g. ``"photo"``).
+
+    Returns:
+        The storage URL, or an empty string when no file is set.
+    """
+    name = stored_file_name(instance, attname)
+    if not name:
+        return ""
+    return instance._meta.get_field(attname).storage.url(name)
+
+
 # --- League ----------------------------------------------------------------
 
 
@@ -45,6 +92,10 @@ class League(models.Model):
             # Stejný název ligy se může opakovat, ale ne ve stejné sezóně
             models.UniqueConstraint(fields=["name", "season"], name="uniq_league_name_season"),
         ]
+        indexes = [
+            # "Ongoing league" lookups filter date_start <= day <= date_end
+            models.Index(fields=("date_start", "date_end")),
+        ]
 
     def clean(self) -> None:
         """Validate model state before saving.
@@ -60,12 +111,16 @@ class League(models.Model):
         """Persist the league and auto-fill ``season`` when empty.
 
         If ``season`` is empty and both dates are present, it is derived from the
-        years of ``date_start`` and ``date_end`` (e.g., ``2025/2026``).
+        years of ``date_start`` and ``date_end`` (e.g., ``2025/2026``). When the
+        caller restricts the write with ``update_fields``, the derived column is
+        added to it so partial updates stay partial but still persist ``season``.
         """
         if not self.season and self.date_start and self.date_end:
             y1 = self.date_start.year
             y2 = self.date_end.year
             self.season = f"{y1}/{y2}"
+            if kwargs.get("update_fields") is not None:
+                kwargs["update_fields"] = {*kwargs["update_fields"], "season"}
         super().save(*args, **kwargs)
 
     def __str__(self) -> str:  # pragma: no cover - trivial
@@ -203,6 +258,11 @@ class Player(models.Model):
     def __str__(self) -> str:  # pragma: no cover - trivial
         return f"{self.first_name} {self.last_name}"
 
+    @property
+    def is_goalie(self) -> bool:
+        """Return ``True`` for goalies; compares the stored code, no query."""
+        return self.position == self.Position.GOALIE
+
     def photo_url(self) -> str:
         """Return a public URL for the player's photo or a static fallback.
 
@@ -211,9 +271,10 @@ class Player(models.Model):
         intentional to avoid breaking templates when storage backends raise
         unexpected runtime errors.
         """
-        if self.photo:
-            try:
-                return self.photo.url
-            except Exception:  # noqa: BLE001 - keep broad to match original behavior
-                pass
+        try:
+            url = stored_file_url(self, "photo")
+        except Exception:  # noqa: BLE001 - keep broad to match original behavior
+            url = ""
+        if url:
+            return url
         return static("powerplay_app/img/default_player.png")
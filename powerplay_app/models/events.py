@@ -16,14 +16,193 @@ This module defines domain objects that capture what happens during a match:
   - :class:`Goal` – a goal with a scorer, up to two assists, and a
     :class:`Strength` value.
   - :class:`Penalty` – a penalty referencing the offending player, duration, and type.
+
+- **Validation cache**
+  - :func:`event_validation_cache` – batch scope in which per-game lookups used by
+    ``clean()`` are fetched once per game instead of once per event;
+    :meth:`GameEventBase.bulk_clean` validates a whole batch inside it.
 """
 
 from __future__ import annotations
 
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterable, Iterator
+
 from django.core.exceptions import ValidationError
 from django.db import models
-
-from .games import GameNomination
+from django.db.models import F, Q
+
+from .core import Player
+from .games import Game, GameNomination
+
+
+# --- Validation cache ------------------------------------------------------
+
+# Per-kind dicts keyed by game (or player) id; ``None`` outside of ``event_validation_cache``.
+_event_cache: ContextVar[dict[str, dict[Any, Any]] | None] = ContextVar("event_validation_cache", default=None)
+
+# Only the game columns event validation needs (participants and score limit)
+_GAME_HEADER_FIELDS = ("home_team_id", "away_team_id", "score_home", "score_away")
+
+
+def _load_nominations(game_ids: set[int]) -> dict[int, set[int]]:
+    """Return nominated player ids per game for ``game_ids`` (one query)."""
+    result: dict[int, set[int]] = {gid: set() for gid in game_ids}
+    rows = GameNomination.objects.filter(game_id__in=game_ids).values_list("game_id", "player_id")
+    for gid, pid in rows:
+        result[gid].add(pid)
+    return result
+
+
+def _load_goal_ids(game_ids: set[int]) -> dict[int, dict[int, set[int]]]:
+    """Return stored goal ids per game and team for ``game_ids`` (one query)."""
+    result: dict[int, dict[int, set[int]]] = {gid: {} for gid in game_ids}
+    rows = Goal.objects.filter(game_id__in=game_ids).values_list("game_id", "team_id", "pk")
+    for gid, tid, pk in rows:
+        result[gid].setdefault(tid, set()).add(pk)
+    return result
+
+
+def _load_game_headers(game_ids: set[int]) -> dict[int, dict[str, Any]]:
+    """Return the score-limit columns of each game in ``game_ids`` (one query)."""
+    rows = Game.objects.filter(pk__in=game_ids).values("pk", *_GAME_HEADER_FIELDS)
+    return {row.pop("pk"): row for row in rows}
+
+
+def _load_player_teams(player_ids: set[int]) -> dict[int, int | None]:
+    """Return the team id of each player in ``player_ids`` (one query)."""
+    return dict(Player.objects.filter(pk__in=player_ids).values_list("id", "team_id"))
+
+
+# Lookups keyed by game id; prefetched together for a batch of games
+_GAME_LOADERS = {
+    "nominations": _load_nominations,
+    "goals": _load_goal_ids,
+    "games": _load_game_headers,
+}
+_CACHE_LOADERS = {**_GAME_LOADERS, "player_teams": _load_player_teams}
+
+
+def _cached_rows(cache: dict[str, dict[Any, Any]], kind: str, keys: Iterable[int]) -> dict[Any, Any]:
+    """Return the ``kind`` bucket of ``cache`` with all ``keys`` loaded."""
+    bucket = cache.setdefault(kind, {})
+    missing = {key for key in keys if key and key not in bucket}
+    if missing:
+        bucket.update(_CACHE_LOADERS[kind](missing))
+    return bucket
+
+
+@contextmanager
+def event_validation_cache(game_ids: Iterable[int] = (), player_ids: Iterable[int] = ()) -> Iterator[None]:
+    """Cache per-game lookups used by ``Goal.clean``/``Penalty.clean``.
+
+    Inside the block each game's nominations and stored goals are read once
+    and reused by every event validated against that game; ``game_ids`` and
+    ``player_ids`` can be given to prefetch a batch up front with one query
+    per lookup. The cache lives only as long as the block (nested blocks share
+    it), so it needs no invalidation, but rows changed inside the block are
+    not seen by later validations.
+
+    Args:
+        game_ids: Optional ids of games to prefetch up front.
+        player_ids: Optional ids of players whose teams to prefetch.
+    """
+    cache = _event_cache.get()
+    token = None
+    if cache is None:
+        cache = {}
+        token = _event_cache.set(cache)
+    try:
+        game_ids = list(game_ids)
+        if game_ids:
+            for kind in _GAME_LOADERS:
+                _cached_rows(cache, kind, game_ids)
+        _cached_rows(cache, "player_teams", player_ids)
+        yield
+    finally:
+        if token is not None:
+            _event_cache.reset(token)
+
+
+def _nominated_among(game_id: int, player_ids: Iterable[int]) -> set[int]:
+    """Return the subset of ``player_ids`` nominated for the game.
+
+    Uses the batch cache when :func:`event_validation_cache` is active,
+    otherwise checks all players with a single ``player_id__in`` query.
+    """
+    pids = set(player_ids)
+    if not pids:
+        return set()
+    cache = _event_cache.get()
+    if cache is None:
+        return set(
+            GameNomination.objects.filter(game_id=game_id, player_id__in=pids).values_list("player_id", flat=True)
+        )
+    return pids & _cached_rows(cache, "nominations", (game_id,))[game_id]
+
+
+def _game_header(event: GameEventBase) -> dict[str, Any] | None:
+    """Return team ids and scores of the event's game.
+
+    A game already attached to the event (e.g. the unsaved parent form in the
+    admin) wins, so edited scores are validated as entered. Otherwise only the
+    header columns are read, from the batch cache when it is active, and kept
+    on the event so the base and subclass ``clean()`` share one lookup.
+    """
+    if GameEventBase._meta.get_field("game").is_cached(event):
+        return {name: getattr(event.game, name) for name in _GAME_HEADER_FIELDS}
+    memo = event.__dict__.get("_game_header_memo")
+    if memo is not None and memo[0] == event.game_id:
+        return memo[1]
+    cache = _event_cache.get()
+    if cache is None:
+        header = Game.objects.filter(pk=event.game_id).values(*_GAME_HEADER_FIELDS).first()
+    else:
+        header = _cached_rows(cache, "games", (event.game_id,)).get(event.game_id)
+    event._game_header_memo = (event.game_id, header)
+    return header
+
+
+def _team_ids_of(event: GameEventBase, *fields: str) -> dict[int, int | None]:
+    """Map player id to team id for the given player FK fields of ``event``.
+
+    Related players already attached to the event are used as-is; the rest
+    are resolved together with one ``values_list`` query (or from the batch
+    cache) instead of one descriptor ``SELECT`` per field. Empty fields are
+    skipped.
+    """
+    team_by_player: dict[int, int | None] = {}
+    missing: list[int] = []
+    for name in fields:
+        pid = getattr(event, f"{name}_id")
+        if not pid:
+            continue
+        if event._meta.get_field(name).is_cached(event):
+            team_by_player[pid] = getattr(event, name).team_id
+        else:
+            missing.append(pid)
+    if missing:
+        cache = _event_cache.get()
+        if cache is None:
+            team_by_player.update(_load_player_teams(set(missing)))
+        else:
+            teams = _cached_rows(cache, "player_teams", missing)
+            team_by_player.update((pid, teams[pid]) for pid in missing if pid in teams)
+    return team_by_player
+
+
+def _other_goal_count(game_id: int, team_id: int, exclude_pk: int | None) -> int:
+    """Return how many stored goals the team has in the game, ignoring ``exclude_pk``.
+
+    Uses the batch cache when :func:`event_validation_cache` is active,
+    otherwise falls back to a single ``COUNT`` query.
+    """
+    cache = _event_cache.get()
+    if cache is None:
+        return Goal.objects.filter(game_id=game_id, team_id=team_id).exclude(pk=exclude_pk).count()
+    goal_ids = _cached_rows(cache, "goals", (game_id,))[game_id].get(team_id, set())
+    return len(goal_ids - {exclude_pk})
 
 
 # --- Enums -----------------------------------------------------------------
@@ -58,6 +237,12 @@ class PenaltyType(models.TextChoices):
     GAME = "20", "Do konce utkání (20)"
 
 
+# Label lookups built once; ``get_<field>_display`` rebuilds a dict per call.
+PERIOD_LABELS: dict[int, str] = dict(Period.choices)
+STRENGTH_LABELS: dict[str, str] = dict(Strength.choices)
+PENALTY_TYPE_LABELS: dict[str, str] = dict(PenaltyType.choices)
+
+
 # --- Base ------------------------------------------------------------------
 
 
@@ -73,19 +258,63 @@ class GameEventBase(models.Model):
     period = models.IntegerField("Třetina", choices=Period.choices)
     second_in_period = models.PositiveIntegerField("Čas")
 
+    # Player FK fields validated against team and nominations (set by subclasses)
+    PLAYER_FIELDS: tuple[str, ...] = ()
+
     class Meta:
         abstract = True
 
+    def clean(self) -> None:
+        """Ensure the event's team is one of the two teams playing the game."""
+        super().clean()
+        header = _game_header(self) if self.game_id and self.team_id else None
+        if header is not None and self.team_id not in (header["home_team_id"], header["away_team_id"]):
+            raise ValidationError("Tým události musí být účastníkem tohoto zápasu.")
+
+    @classmethod
+    def bulk_clean(cls, events: Iterable[GameEventBase]) -> dict[int, ValidationError]:
+        """Run ``clean()`` for many events with lookups shared across the batch.
+
+        Game headers, nominations, stored goals and player teams are loaded
+        with one query each for all events instead of per event. Only the
+        domain checks of ``clean()`` run; field validation (``clean_fields``)
+        stays with the caller. Goals accepted earlier in the batch count
+        towards the score limit of later ones.
+
+        Args:
+            events: Unsaved or existing events, possibly of different games.
+
+        Returns:
+            dict[int, ValidationError]: Errors keyed by position in ``events``.
+        """
+        events = list(events)
+        game_ids = {e.game_id for e in events if e.game_id}
+        player_ids = {getattr(e, f"{name}_id") for e in events for name in e.PLAYER_FIELDS}
+        errors: dict[int, ValidationError] = {}
+        with event_validation_cache(game_ids, player_ids=player_ids - {None}):
+            for idx, event in enumerate(events):
+                try:
+                    event.clean()
+                except ValidationError as exc:
+                    errors[idx] = exc
+                else:
+                    event._note_validated()
+        return errors
+
+    def _note_validated(self) -> None:
+        """Hook for :meth:`bulk_clean` to record an accepted event in the cache."""
+
     # >>> ADDED: jednotné zobrazení času „mm:ss“
     @property
     def clock(self) -> str:
         """Return mm:ss based on ``second_in_period`` (no DB changes)."""
-        try:
-            total = int(self.second_in_period or 0)
-        except (TypeError, ValueError):
-            return ""
-        m, s = divmod(total, 60)
-        return f"{m}:{s:02d}"
+        total = self.second_in_period or 0
+        return f"{total // 60}:{total % 60:02d}"
+
+    @property
+    def period_label(self) -> str:
+        """Czech period label; same as ``get_period_display`` without the per-call dict."""
+        return PERIOD_LABELS.get(self.period, str(self.period))
 
 
 # --- Concrete events -------------------------------------------------------
@@ -120,46 +349,68 @@ class Goal(GameEventBase):
         "Síla hry", max_length=2, choices=Strength.choices, default=Strength.EV
     )
 
+    PLAYER_FIELDS = ("scorer", "assist_1", "assist_2")
+
     class Meta:
         verbose_name = "Gól"
         verbose_name_plural = "Góly"
+        # Score-limit COUNT and per-team goal lists filter by both columns
+        indexes = [models.Index(fields=("game", "team"))]
+        # DB backstop for bulk_create/update paths that never call clean()
+        constraints = [
+            models.CheckConstraint(
+                condition=~Q(assist_1=F("scorer")),
+                name="goal_assist_1_not_scorer",
+                violation_error_message="Asistent 1 nesmí být zároveň střelcem.",
+            ),
+            models.CheckConstraint(
+                condition=~Q(assist_2=F("scorer")) & ~Q(assist_2=F("assist_1")),
+                name="goal_assist_2_distinct",
+                violation_error_message="Asistent 2 nesmí být střelcem ani shodný s Asistentem 1.",
+            ),
+        ]
 
-    def clean(self) -> None:
-        """Domain validation for goals."""
-        super().clean()
+    @property
+    def strength_label(self) -> str:
+        """Czech strength label; same as ``get_strength_display``."""
+        return STRENGTH_LABELS.get(self.strength, self.strength)
 
-        players = [self.scorer, self.assist_1, self.assist_2]
-        for player in filter(None, players):
-            if player.team_id != self.team_id:
-                raise ValidationError(
-                    "Střelec i asistenti musí být z týmu, který gól vstřelil."
-                )
-            if self.game_id and not GameNomination.objects.filter(
-                game_id=self.game_id, player_id=player.id
-            ).exists():
-                raise ValidationError(
-                    "Střelec/asistenti musí být nominováni do tohoto zápasu."
-                )
+    def clean(self) -> None:
+        """Domain validation for goals.
 
-        if self.assist_1 and self.assist_1_id == self.scorer_id:
+        Pure id comparisons run first so an obviously invalid goal is rejected
+        before any lookup touches the database.
+        """
+        if self.assist_1_id and self.assist_1_id == self.scorer_id:
             raise ValidationError("Asistent 1 nesmí být zároveň střelcem.")
 
-        if self.assist_2 and (
+        if self.assist_2_id and (
             self.assist_2_id == self.scorer_id
             or self.assist_2_id == self.assist_1_id
         ):
             raise ValidationError(
                 "Asistent 2 nesmí být střelcem ani shodný s Asistentem 1."
             )
+
+        super().clean()
+
+        team_by_player = _team_ids_of(self, *self.PLAYER_FIELDS)
+        if any(team_id != self.team_id for team_id in team_by_player.values()):
+            raise ValidationError(
+                "Střelec i asistenti musí být z týmu, který gól vstřelil."
+            )
+        if self.game_id and set(team_by_player) - _nominated_among(self.game_id, team_by_player):
+            raise ValidationError(
+                "Střelec/asistenti musí být nominováni do tohoto zápasu."
+            )
+
         # --- Limit podle SKÓRE (ruční i API) ---
-        if self.game_id and self.team_id:
-            is_home = (self.team_id == self.game.home_team_id)
-            limit = int(self.game.score_home if is_home else self.game.score_away)
+        header = _game_header(self) if self.game_id and self.team_id else None
+        if header is not None:
+            is_home = (self.team_id == header["home_team_id"])
+            limit = int(header["score_home"] if is_home else header["score_away"])
 
-            from powerplay_app.models import Goal as GoalModel
-            already = GoalModel.objects.filter(
-                game_id=self.game_id, team_id=self.team_id
-            ).exclude(pk=self.pk).count()
+            already = _other_goal_count(self.game_id, self.team_id, self.pk)
 
             if already + 1 > limit:
                 side = "domácích" if is_home else "hostů"
@@ -168,6 +419,23 @@ class Goal(GameEventBase):
                     "Nejdřív upravte Skóre v hlavičce zápasu."
                 )
 
+    def validate_constraints(self, exclude: Any = None) -> None:
+        """Skip the assist check constraints, already enforced by :meth:`clean`.
+
+        ``CheckConstraint.validate`` evaluates its condition with a query; the
+        same rule is a plain id comparison in ``clean()``, so full validation
+        does not pay two extra round trips per goal.
+        """
+        super().validate_constraints(exclude={*(exclude or ()), "assist_1", "assist_2"})
+
+    def _note_validated(self) -> None:
+        """Count this goal towards its team's total for the rest of the batch."""
+        cache = _event_cache.get()
+        if cache is None or not (self.game_id and self.team_id):
+            return
+        goals = _cached_rows(cache, "goals", (self.game_id,))[self.game_id]
+        goals.setdefault(self.team_id, set()).add(self.pk or ("new", id(self)))
+
 
 class Penalty(GameEventBase):
     """Penalty assigned to a player within a specific game/team context."""
@@ -181,15 +449,24 @@ class Penalty(GameEventBase):
     )
     reason = models.CharField("Důvod", max_length=200, blank=True)
 
+    PLAYER_FIELDS = ("penalized_player",)
+
     class Meta:
         verbose_name = "Trest"
         verbose_name_plural = "Tresty"
+        indexes = [models.Index(fields=("game", "penalized_player"))]
+
+    @property
+    def penalty_type_label(self) -> str:
+        """Czech penalty type label; same as ``get_penalty_type_display``."""
+        return PENALTY_TYPE_LABELS.get(self.penalty_type, self.penalty_type)
 
     def clean(self) -> None:
         """Domain validation for penalties."""
         super().clean()
 
-        if self.penalized_player and self.penalized_player.team_id != self.team_id:
+        team_by_player = _team_ids_of(self, *self.PLAYER_FIELDS)
+        if team_by_player.get(self.penalized_player_id, self.team_id) != self.team_id:
             raise ValidationError(
                 "Trest musí být připsán týmu, za který faulující hráč hraje v zápase."
             )
@@ -197,9 +474,7 @@ class Penalty(GameEventBase):
         if (
             self.game_id
             and self.penalized_player_id
-            and not GameNomination.objects.filter(
-                game_id=self.game_id, player_id=self.penalized_player_id
-            ).exists()
+            and not _nominated_among(self.game_id, (self.penalized_player_id,))
         ):
             raise ValidationError(
                 "Faulující hráč musí být nominován do tohoto zápasu."
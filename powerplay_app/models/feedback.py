@@ -6,13 +6,16 @@ feedback scoped to a team. Each entry may optionally reference an individual
 :class:`~powerplay_app.models.Game` or a calendar
 :class:`~powerplay_app.models.TeamEvent`. Author information is stored both as
 an FK (``created_by``) and as a denormalized snapshot (``created_by_name``) so
-that labels remain stable if accounts change later.
+that labels remain stable if accounts change later; the team name is
+snapshotted the same way (``team_name``) for cheap string labels.
 
 UI labels (``verbose_name`` etc.) are Czech; internal documentation is English.
 """
 
 from __future__ import annotations
 
+from typing import Any
+
 from django.conf import settings
 from django.db import models
 
@@ -68,14 +71,56 @@ class GameFeedback(models.Model):
     created_by_name = models.CharField(
         "Jméno autora (snapshot)", max_length=120, blank=True
     )
+    team_name = models.CharField(
+        "Název týmu (snapshot)", max_length=255, blank=True, editable=False
+    )
 
     class Meta:
         verbose_name = "Připomínka"
         verbose_name_plural = "Připomínky"
-        ordering = ("-created_at",)
-        indexes = [models.Index(fields=("team", "created_at"))]
+        # No default ordering: listings order explicitly, counts/EXISTS stay unsorted
+        indexes = [
+            models.Index(fields=("team", "created_at")),
+            models.Index(fields=("-created_at",)),
+        ]
+
+    @classmethod
+    def from_db(cls, db: str | None, field_names: Any, values: Any) -> "GameFeedback":
+        """Remember the stored team id so :meth:`save` can spot reassignment."""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_team_id = instance.__dict__.get("team_id")
+        return instance
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        """Snapshot the team name when missing or the team changed, then persist."""
+        team_changed = self.team_id != getattr(self, "_loaded_team_id", None)
+        if self.team_id and (team_changed or not self.team_name):
+            team_field = self._meta.get_field("team")
+            if team_field.is_cached(self):
+                self.team_name = self.team.name
+            else:
+                self.team_name = (
+                    team_field.related_model._default_manager.filter(pk=self.team_id)
+                    .values_list("name", flat=True)
+                    .first()
+                    or ""
+                )
+            if kwargs.get("update_fields") is not None:
+                kwargs["update_fields"] = {*kwargs["update_fields"], "team_name"}
+        super().save(*args, **kwargs)
+        self._loaded_team_id = self.team_id
 
     def __str__(self) -> str:  # pragma: no cover
-        """Short label for admin lists (team, subject preview, and target)."""
-        target = self.related_event or self.related_game or "bez vazby"
-        return f"[{self.team}] {self.subject or self.message[:25]}… → {target}"
+        """Short label for admin lists (team, subject preview, and target).
+
+        Team and target are rendered from the snapshot and FK ids so that
+        labelling feedback does not load any related rows.
+        """
+        if self.related_event_id:
+            target = f"událost #{self.related_event_id}"
+        elif self.related_game_id:
+            target = f"zápas #{self.related_game_id}"
+        else:
+            target = "bez vazby"
+        team = self.team_name or f"tým #{self.team_id}"
+        return f"[{team}] {self.subject or self.message[:25]}… → {target}"
@@ -15,7 +15,7 @@ and schema are unchanged.
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Iterable
 
 from django.core.exceptions import ValidationError
 from django.db import models
@@ -127,10 +127,21 @@ class Game(models.Model):
                 condition=Q(competition=GameCompetition.FRIENDLY),
             ),
         ]
+        indexes = [
+            # Schedule/next/latest game lookups range-scan and sort by kickoff
+            models.Index(fields=("starts_at",)),
+            # A team's schedule is OR-ed over home/away and bounded by kickoff
+            models.Index(fields=("home_team", "starts_at")),
+            models.Index(fields=("away_team", "starts_at")),
+        ]
 
     def clean(self) -> None:
         """Validate team distinctness and competition-specific rules.
 
+        Competition rules live in one ``_validate_*`` method per competition,
+        picked from :attr:`_COMPETITION_VALIDATORS`; unknown values fall back
+        to the friendly rules.
+
         Raises:
             ValidationError: If any business rule is violated.
         """
@@ -138,50 +149,95 @@ class Game(models.Model):
         if self.home_team_id and self.home_team_id == self.away_team_id:
             raise ValidationError("Domácí a hostující tým nesmí být stejný.")
 
-        # Competition rules
-        if self.competition == GameCompetition.LEAGUE:
-            if not self.league_id:
-                raise ValidationError({"league": "Ligový zápas musí mít vybranou ligu."})
-            if self.tournament_id:
-                raise ValidationError({"tournament": "Ligový zápas nesmí mít vyplněný turnaj."})
-
-            # Both teams must belong to the selected league
-            if self.home_team and self.home_team.league_id != self.league_id:
-                raise ValidationError({"home_team": "Domácí tým nepatří do zvolené ligy."})
-            if self.away_team and self.away_team.league_id != self.league_id:
-                raise ValidationError({"away_team": "Hostující tým nepatří do zvolené ligy."})
-
-            # Date must be within league season interval
-            if (
-                self.starts_at
-                and self.league
-                and self.league.date_start
-                and self.league.date_end
-            ):
-                d = self.starts_at.date()
-                if not (self.league.date_start <= d <= self.league.date_end):
-                    raise ValidationError({"starts_at": "Termín zápasu je mimo rozmezí sezóny ligy."})
-
-        elif self.competition == GameCompetition.TOURNAMENT:
-            if not self.tournament_id:
-                raise ValidationError({"tournament": "Turnajový zápas musí mít vybraný turnaj."})
-            if self.league_id:
-                raise ValidationError({"league": "Turnajový zápas nesmí mít vybranou ligu."})
-
-            # Date must be within tournament interval (when present)
-            if (
-                self.starts_at
-                and self.tournament
-                and self.tournament.date_start
-                and self.tournament.date_end
-            ):
-                d = self.starts_at.date()
-                if not (self.tournament.date_start <= d <= self.tournament.date_end):
-                    raise ValidationError({"starts_at": "Termín zápasu je mimo rozmezí turnaje."})
-
-        else:  # FRIENDLY
-            if self.league_id or self.tournament_id:
-                raise ValidationError("Přátelský zápas nesmí mít vyplněnou ligu/turnaj.")
+        validate = self._COMPETITION_VALIDATORS.get(self.competition, Game._validate_friendly)
+        validate(self)
+
+    def _validate_league(self) -> None:
+        """League games need a league (no tournament), its teams and season dates."""
+        if not self.league_id:
+            raise ValidationError({"league": "Ligový zápas musí mít vybranou ligu."})
+        if self.tournament_id:
+            raise ValidationError({"tournament": "Ligový zápas nesmí mít vyplněný turnaj."})
+
+        # Both teams must belong to the selected league
+        team_leagues = self._team_league_ids()
+        if self.home_team_id and team_leagues.get(self.home_team_id) != self.league_id:
+            raise ValidationError({"home_team": "Domácí tým nepatří do zvolené ligy."})
+        if self.away_team_id and team_leagues.get(self.away_team_id) != self.league_id:
+            raise ValidationError({"away_team": "Hostující tým nepatří do zvolené ligy."})
+
+        self._check_within_bounds("league", "Termín zápasu je mimo rozmezí sezóny ligy.")
+
+    def _validate_tournament(self) -> None:
+        """Tournament games need a tournament (no league) and its dates."""
+        if not self.tournament_id:
+            raise ValidationError({"tournament": "Turnajový zápas musí mít vybraný turnaj."})
+        if self.league_id:
+            raise ValidationError({"league": "Turnajový zápas nesmí mít vybranou ligu."})
+
+        self._check_within_bounds("tournament", "Termín zápasu je mimo rozmezí turnaje.")
+
+    def _validate_friendly(self) -> None:
+        """Friendly games carry neither a league nor a tournament."""
+        if self.league_id or self.tournament_id:
+            raise ValidationError("Přátelský zápas nesmí mít vyplněnou ligu/turnaj.")
+
+    _COMPETITION_VALIDATORS = {
+        GameCompetition.LEAGUE: _validate_league,
+        GameCompetition.TOURNAMENT: _validate_tournament,
+        GameCompetition.FRIENDLY: _validate_friendly,
+    }
+
+    def _check_within_bounds(self, name: str, message: str) -> None:
+        """Reject ``starts_at`` outside the related league/tournament dates (when both set)."""
+        if not self.starts_at:
+            return
+        date_start, date_end = self._date_bounds(name)
+        if date_start and date_end and not (date_start <= self.starts_at.date() <= date_end):
+            raise ValidationError({"starts_at": message})
+
+    def _team_league_ids(self) -> dict[int, int | None]:
+        """Map the home/away team ids to their league ids.
+
+        Teams already attached to the instance (e.g. by a model form) are used
+        as-is; the remaining ones are read together with one ``values_list``
+        query instead of one descriptor ``SELECT`` per team.
+        """
+        leagues: dict[int, int | None] = {}
+        missing: list[int] = []
+        for name in ("home_team", "away_team"):
+            field = self._meta.get_field(name)
+            team_id = getattr(self, field.attname)
+            if not team_id:
+                continue
+            if field.is_cached(self):
+                leagues[team_id] = getattr(self, name).league_id
+            else:
+                missing.append(team_id)
+        if missing:
+            team_model = self._meta.get_field("home_team").related_model
+            leagues.update(team_model._default_manager.filter(pk__in=missing).values_list("pk", "league_id"))
+        return leagues
+
+    def _date_bounds(self, name: str) -> tuple[Any, Any]:
+        """Return ``(date_start, date_end)`` of the related league or tournament.
+
+        Uses the cached related instance when present, otherwise reads only the
+        two date columns. Missing relations yield ``(None, None)``.
+        """
+        field = self._meta.get_field(name)
+        if field.is_cached(self):
+            related = getattr(self, name)
+            return related.date_start, related.date_end
+        pk = getattr(self, field.attname)
+        if not pk:
+            return None, None
+        bounds = (
+            field.related_model._default_manager.filter(pk=pk)
+            .values_list("date_start", "date_end")
+            .first()
+        )
+        return bounds or (None, None)
 
     def __str__(self) -> str:  # pragma: no cover - trivial
         """Readable label: ``Home vs Away (YYYY-MM-DD HH:MM)``."""
@@ -238,7 +294,7 @@ class GameNomination(models.Model):
             team is not participating in the game.
         """
         # Player must belong to the selected team
-        if self.player_id and self.team_id and self.player.team_id != self.team_id:
+        if self.player_id and self.team_id and self._player_team_id() != self.team_id:
             raise ValidationError("Hráč nepatří do vybraného týmu.")
 
         # Team must participate in the game
@@ -249,10 +305,49 @@ class GameNomination(models.Model):
         ):
             raise ValidationError("Tým v nominaci není účastníkem tohoto zápasu.")
 
+    @classmethod
+    def bulk_nominate(cls, game_id: int, player_ids: Iterable[int]) -> list[GameNomination]:
+        """Nominate several players for a game in two queries.
+
+        Teams are read for all players at once and the rows are inserted with a
+        single ``bulk_create``; existing nominations are skipped via
+        ``ignore_conflicts``. Like any bulk insert this bypasses :meth:`clean`,
+        so callers pass players of the participating teams.
+
+        Returns:
+            The nomination instances passed to ``bulk_create`` (without pks).
+        """
+        player_model = cls._meta.get_field("player").related_model
+        rows = player_model._default_manager.filter(pk__in=set(player_ids)).values_list("pk", "team_id")
+        objs = [cls(game_id=game_id, player_id=pid, team_id=team_id) for pid, team_id in rows]
+        return cls.objects.bulk_create(objs, ignore_conflicts=True)
+
+    def _player_team_id(self) -> int | None:
+        """Return the player's team id, loading only that column when needed.
+
+        Uses the cached ``player`` instance when the caller already attached
+        one; otherwise reads a single ``team_id`` value instead of the whole
+        player row.
+        """
+        player_field = self._meta.get_field("player")
+        if player_field.is_cached(self):
+            return self.player.team_id
+        return (
+            player_field.related_model._default_manager.filter(pk=self.player_id)
+            .values_list("team_id", flat=True)
+            .first()
+        )
+
     def save(self, *args: Any, **kwargs: Any) -> None:
-        """Fill ``team`` from player's current team if missing, then persist."""
+        """Fill ``team`` from player's current team if missing, then persist.
+
+        A filled-in ``team`` is appended to a caller-supplied ``update_fields``
+        so that narrow updates do not silently drop it.
+        """
         if not self.team_id and self.player_id:
-            self.team_id = self.player.team_id
+            self.team_id = self._player_team_id()
+            if kwargs.get("update_fields") is not None:
+                kwargs["update_fields"] = {*kwargs["update_fields"], "team"}
         super().save(*args, **kwargs)
 
     def __str__(self) -> str:  # pragma: no cover - trivial
@@ -321,10 +416,20 @@ class LineAssignment(models.Model):
         * Player must belong to the same team as the line.
         * Line ``0`` is goalie-only: only slot ``G`` is allowed and, if filled,
           the player's position must be goalie.
-        * A player cannot appear in multiple lines for the same game.
+
+    A player cannot appear in multiple lines for the same game. ``game`` mirrors
+    ``line.game`` (filled in :meth:`save`) so the database enforces this with
+    the partial unique constraint ``uniq_lineassignment_game_player``.
     """
 
     line = models.ForeignKey(Line, on_delete=models.CASCADE, related_name="players", verbose_name="Lajna")
+    game = models.ForeignKey(
+        Game,
+        on_delete=models.CASCADE,
+        related_name="line_assignments",
+        verbose_name="Zápas",
+        editable=False,  # Always derived from ``line.game``
+    )
     player = models.ForeignKey(
         "powerplay_app.Player",
         on_delete=models.CASCADE,
@@ -336,11 +441,26 @@ class LineAssignment(models.Model):
 
     class Meta:
         unique_together = (("line", "slot"),)
+        constraints = [
+            models.UniqueConstraint(
+                fields=("game", "player"),
+                name="uniq_lineassignment_game_player",
+                condition=Q(player__isnull=False),
+                violation_error_message="Hráč už je přiřazen v jiné lajně v tomto zápase.",
+            ),
+        ]
         verbose_name = "Hráč v lajně"
         verbose_name_plural = "Hráči v lajně"
 
     def clean(self) -> None:
-        """Validate team consistency, goalie rules, and uniqueness per game."""
+        """Validate team consistency and goalie rules.
+
+        Also copies ``line.game_id`` onto the instance so the per-game
+        uniqueness constraint can be checked by :meth:`validate_constraints`.
+        """
+        if self.line_id:
+            self.game_id = self.line.game_id
+
         # Player must be from the same team as the line
         if self.line_id and self.player_id:
             if self.player.team_id != self.line.team_id:
@@ -350,19 +470,28 @@ class LineAssignment(models.Model):
         if self.line and self.line.line_number == 0:
             if self.slot != LineSlot.G:
                 raise ValidationError("V brankářské lajně (0) je povolen pouze post Brankář.")
-            if self.player_id and self.player.position != "goalie":
+            if self.player_id and not self.player.is_goalie:
                 raise ValidationError("Do brankářské lajny lze přiřadit jen hráče s pozicí Brankář.")
 
-        # Player cannot be assigned to another line in the same game
-        if self.player_id and self.line_id:
-            game_id = self.line.game_id
-            exists_elsewhere = (
-                LineAssignment.objects.filter(player_id=self.player_id, line__game_id=game_id)
-                .exclude(pk=self.pk)
-                .exists()
-            )
-            if exists_elsewhere:
-                raise ValidationError("Hráč už je přiřazen v jiné lajně v tomto zápase.")
+    def validate_constraints(self, exclude: Any = None) -> None:
+        """Always check the per-game constraint, even though ``game`` is not a form field.
+
+        Model forms exclude fields they do not render, which would otherwise
+        leave a duplicate player to surface as an ``IntegrityError`` on save.
+        """
+        super().validate_constraints(exclude=set(exclude or ()) - {"game"})
+
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        """Copy ``game`` from the line, then persist.
+
+        A changed ``game`` is appended to a caller-supplied ``update_fields``
+        so that narrow updates keep it in sync.
+        """
+        if self.line_id and self.game_id != self.line.game_id:
+            self.game_id = self.line.game_id
+            if kwargs.get("update_fields") is not None:
+                kwargs["update_fields"] = {*kwargs["update_fields"], "game"}
+        super().save(*args, **kwargs)
 
     def __str__(self) -> str:  # pragma: no cover - trivial
         """Readable label with player (or placeholder), slot, and line."""
@@ -12,9 +12,11 @@ UI labels (``verbose_name`` etc.) are Czech; internal documentation is English.
 
 from __future__ import annotations
 
+from typing import Any
+
 from django.core.exceptions import ValidationError
 from django.db import models
-from django.db.models import Q
+from django.db.models import F, Q
 
 
 # --- Model -----------------------------------------------------------------
@@ -97,7 +99,13 @@ class TeamEvent(models.Model):
                 fields=["related_game"],
                 name="uniq_event_per_game",
                 condition=Q(related_game__isnull=False),
-            )
+            ),
+            # Also guards bulk inserts, which skip ``clean()``.
+            models.CheckConstraint(
+                condition=Q(ends_at__gte=F("starts_at")),
+                name="teamevent_ends_not_before_start",
+                violation_error_message="Konec události musí být po začátku.",
+            ),
         ]
 
     # --- Validation ---------------------------------------------------------
@@ -129,6 +137,10 @@ class TeamEvent(models.Model):
         if self.event_type == self.EventType.GAME:
             self.team = None
 
+    def validate_constraints(self, exclude: Any = None) -> None:
+        """Skip the time-order check, already in :meth:`clean` (see ``Goal.validate_constraints``)."""
+        super().validate_constraints(exclude={*(exclude or ()), "ends_at"})
+
     # --- Display ------------------------------------------------------------
 
     def __str__(self) -> str:  # pragma: no cover - trivial
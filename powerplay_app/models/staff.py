@@ -8,16 +8,37 @@ regex validator. All user-facing labels remain Czech.
 
 from __future__ import annotations
 
+import re
+
 from django.core.validators import RegexValidator
 from django.db import models
 
-# Validator is defined at module scope for reuse and easier testing.
+# Validator is defined at module scope for reuse and easier testing. The pattern
+# is compiled once at import; ``\A``/``\Z`` anchor the whole value (``$`` would
+# also accept a trailing newline).
+_PHONE_RE = re.compile(r"\A\+?[0-9\- ]{7,20}\Z")
+
 phone_validator: RegexValidator = RegexValidator(
-    regex=r"^\+?[0-9\- ]{7,20}$",
+    regex=_PHONE_RE,
     message="Zadej platné telefonní číslo (např. +420 123 456 789).",
 )
 
 
+# --- QuerySet --------------------------------------------------------------
+
+
+class StaffQuerySet(models.QuerySet):
+    """Queryset helpers for staff listings."""
+
+    def list_view(self) -> "StaffQuerySet":
+        """Defer the long text columns that list pages never render.
+
+        ``role_description`` and ``address`` are shown on the detail page only;
+        accessing them on a listed row costs one extra query for that row.
+        """
+        return self.defer("role_description", "address")
+
+
 # --- Model -----------------------------------------------------------------
 
 
@@ -53,6 +74,8 @@ class Staff(models.Model):
     is_active = models.BooleanField("Aktivní", default=True)
     order = models.PositiveIntegerField("Pořadí", default=0)
 
+    objects = StaffQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Člen realizačního týmu"
         verbose_name_plural = "Realizační tým"
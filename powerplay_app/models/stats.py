@@ -57,7 +57,8 @@ class PlayerStats(models.Model):
 
     @property
     def pim(self) -> int:
-        return getattr(self, "minutes", 0) or 0
+        """Penalty minutes under the short name used by templates."""
+        return self.penalty_minutes
 
     def __str__(self) -> str:  # pragma: no cover - trivial
         """Readable label combining player and game."""
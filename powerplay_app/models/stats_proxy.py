@@ -14,19 +14,67 @@ Notes:
 
 from __future__ import annotations
 
+from typing import Any
+
 from django.db import models
+from django.db.models import Count, F, IntegerField, OuterRef, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
 
 from .core import Player  # ``Player`` is defined in core.py
 
 
+# --- QuerySet ----------------------------------------------------------------
+
+
+class PlayerSeasonTotalsQuerySet(models.QuerySet):
+    """Queryset helpers computing per-player totals in the database."""
+
+    def with_season_totals(self, league: Any | None = None) -> "PlayerSeasonTotalsQuerySet":
+        """Annotate ``games_played``, ``goals``, ``assists``, ``points``,
+        ``penalty_minutes`` and ``goals_against``.
+
+        The four ``PlayerStats`` sums come from a single ``LEFT JOIN`` +
+        ``GROUP BY``; games played are counted from nominations in one separate
+        subquery so the two multi-valued relations never multiply each other.
+
+        Args:
+            league: Optional league (or its id) to restrict totals to one
+                season; ``None`` aggregates across all games.
+
+        Returns:
+            PlayerSeasonTotalsQuerySet: The annotated queryset.
+        """
+        from .games import GameNomination  # local import to avoid a cycle
+
+        stats_filter = Q(stats__game__league=league) if league is not None else None
+        gp_qs = GameNomination.objects.filter(player=OuterRef("pk"))
+        if league is not None:
+            gp_qs = gp_qs.filter(game__league=league)
+        gp_sq = gp_qs.values("player").annotate(gp=Count("game", distinct=True)).values("gp")[:1]
+
+        return self.annotate(
+            games_played=Coalesce(Subquery(gp_sq, output_field=IntegerField()), Value(0)),
+            goals=Coalesce(Sum("stats__goals", filter=stats_filter), 0),
+            assists=Coalesce(Sum("stats__assists", filter=stats_filter), 0),
+            penalty_minutes=Coalesce(Sum("stats__penalty_minutes", filter=stats_filter), 0),
+            goals_against=Coalesce(Sum("stats__goals_against", filter=stats_filter), 0),
+        ).annotate(points=F("goals") + F("assists"))
+
+
+# --- Model -------------------------------------------------------------------
+
+
 class PlayerSeasonTotals(Player):
     """Read‑only view of a player intended for seasonal totals in admin/UI.
 
     This is a proxy to ``Player``—it does not create a new table. Use it to
     register separate Django admin screens or specialized views without altering
-    the base ``Player`` model or its schema.
+    the base ``Player`` model or its schema. Totals are computed at read time via
+    :meth:`PlayerSeasonTotalsQuerySet.with_season_totals`.
     """
 
+    objects = PlayerSeasonTotalsQuerySet.as_manager()
+
     class Meta:
         proxy = True
         verbose_name = "Souhrnná statistika hráče"
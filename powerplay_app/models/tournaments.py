@@ -11,10 +11,13 @@ and schema are unchanged.
 
 from __future__ import annotations
 
+from collections import defaultdict
 from typing import Any
 
 from django.db import models
-from django.db.models import F, Sum
+from django.db.models import Sum
+
+_TALLY_KEYS = ("wins", "draws", "losses", "goals_for", "goals_against")
 
 
 class Tournament(models.Model):
@@ -51,56 +54,53 @@ class Tournament(models.Model):
         then goal difference (desc).
 
         Notes:
-            ``PlayerStats`` is imported lazily to avoid circular imports.
+            The table is built from three queries regardless of the number of
+            teams: the game scores, the penalty minutes grouped by team and the
+            team rows themselves. ``PlayerStats`` and ``Team`` are imported
+            lazily to avoid circular imports.
         """
+        from .core import Team  # lazy import to avoid circular dependency
         from .stats import PlayerStats  # lazy import to avoid circular dependency
 
-        teams: set[Any] = set()
-        for g in self.games.select_related("home_team", "away_team").all():
-            teams.add(g.home_team)
-            teams.add(g.away_team)
-
-        table: list[dict[str, Any]] = []
-        for team in teams:
-            home = self.games.filter(home_team=team)
-            away = self.games.filter(away_team=team)
-
-            wins = home.filter(score_home__gt=F("score_away")).count() + away.filter(
-                score_away__gt=F("score_home")
-            ).count()
-            draws = home.filter(score_home=F("score_away")).count() + away.filter(
-                score_away=F("score_home")
-            ).count()
-            losses = home.filter(score_home__lt=F("score_away")).count() + away.filter(
-                score_away__lt=F("score_home")
-            ).count()
-            points = wins * 3 + draws
-
-            goals_for = (home.aggregate(s=Sum("score_home"))[
-                "s"
-            ] or 0) + (away.aggregate(s=Sum("score_away"))["s"] or 0)
-            goals_against = (home.aggregate(s=Sum("score_away"))[
-                "s"
-            ] or 0) + (away.aggregate(s=Sum("score_home"))["s"] or 0)
-            penalty_minutes = (
-                PlayerStats.objects.filter(player__team=team, game__in=self.games.all()).aggregate(
-                    s=Sum("penalty_minutes")
-                )["s"]
-                or 0
-            )
-
-            table.append(
-                {
-                    "team": team,
-                    "points": points,
-                    "wins": wins,
-                    "draws": draws,
-                    "losses": losses,
-                    "goals_for": goals_for,
-                    "goals_against": goals_against,
-                    "penalty_minutes": penalty_minutes,
-                }
-            )
+        tallies: defaultdict[int, dict[str, int]] = defaultdict(
+            lambda: dict.fromkeys(_TALLY_KEYS, 0)
+        )
+        games = self.games.values_list("home_team_id", "away_team_id", "score_home", "score_away")
+        for home_id, away_id, score_home, score_away in games:
+            for team_id, scored, conceded in (
+                (home_id, score_home, score_away),
+                (away_id, score_away, score_home),
+            ):
+                row = tallies[team_id]
+                row["goals_for"] += scored
+                row["goals_against"] += conceded
+                if scored > conceded:
+                    row["wins"] += 1
+                elif scored == conceded:
+                    row["draws"] += 1
+                else:
+                    row["losses"] += 1
+
+        if not tallies:
+            return []
+
+        penalty_minutes = dict(
+            PlayerStats.objects.filter(game__tournaments=self, player__team_id__in=tallies)
+            .values("player__team_id")
+            .annotate(pim=Sum("penalty_minutes"))
+            .values_list("player__team_id", "pim")
+        )
+        teams = Team.objects.in_bulk(tallies)
+
+        table: list[dict[str, Any]] = [
+            {
+                "team": teams[team_id],
+                "points": row["wins"] * 3 + row["draws"],
+                **row,
+                "penalty_minutes": penalty_minutes.get(team_id) or 0,
+            }
+            for team_id, row in tallies.items()
+        ]
 
         # Sort by points desc, then goal difference desc.
         return sorted(table, key=lambda x: (-x["points"], -(x["goals_for"] - x["goals_against"])) )
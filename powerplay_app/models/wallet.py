@@ -11,10 +11,17 @@ documentation is English.
 from __future__ import annotations
 
 from decimal import Decimal
+from typing import Any
 
+from django.core.cache import cache
 from django.db import models
 
 
+def wallet_years_cache_key(team_id: int) -> str:
+    """Return the cache key for the years in which a team has transactions."""
+    return f"wallet:years:v1:{team_id}"
+
+
 # --- Categories ------------------------------------------------------------
 
 
@@ -95,6 +102,18 @@ class WalletTransaction(models.Model):
         """
         return self.amount if self.kind == self.Kind.INCOME else -self.amount
 
+    def save(self, *args: Any, **kwargs: Any) -> None:
+        """Persist and drop the team's cached year list (wallet filter)."""
+        super().save(*args, **kwargs)
+        cache.delete(wallet_years_cache_key(self.team_id))
+
+    def delete(self, *args: Any, **kwargs: Any) -> tuple[int, dict[str, int]]:
+        """Delete and drop the team's cached year list (wallet filter)."""
+        team_id = self.team_id
+        result = super().delete(*args, **kwargs)
+        cache.delete(wallet_years_cache_key(team_id))
+        return result
+
     def __str__(self) -> str:  # pragma: no cover
         """Concise summary label for lists and admin."""
         sign = "+" if self.kind == self.Kind.INCOME else "−"
@@ -9,16 +9,20 @@ Highlights
 - `ProfileForm` updates only the e‑mail field; names are read-only.
 - `FeedbackForm` offers an optional target (event or game) limited to ±30 days
   around *now* and exposes the selected window via `._range_start/_range_end`.
+  The choice labels are cached per team for a minute; a submitted target is
+  re-checked against the database.
 """
 
 from __future__ import annotations
 
-from datetime import timedelta
+from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any, TYPE_CHECKING
 
 from django import forms
 from django.contrib.auth.models import User
-from django.db.models import Q
+from django.core.cache import cache
+from django.db.models import Q, QuerySet
 from django.utils import timezone
 
 from powerplay_app.models.feedback import GameFeedback
@@ -29,6 +33,97 @@ if TYPE_CHECKING:  # for type hints only; avoids runtime import coupling
     from powerplay_app.models import Team
 
 
+# Placeholder row shared by the class-level field and the per-instance choices
+TARGET_EMPTY_CHOICE = ("", "— vyber událost nebo zápas —")
+
+
+# --- Feedback target choices ----------------------------------------------
+
+# Events/games offered as feedback targets lie within ±N days around *now*
+TARGET_WINDOW_DAYS = 30
+TARGET_WINDOW = timedelta(days=TARGET_WINDOW_DAYS)
+# Choices are rebuilt at most once per team and minute (GET + invalid POST bursts)
+TARGET_CHOICES_TTL = 60
+# Display labels for ``TeamEvent.event_type`` values read via ``values_list``
+EVENT_TYPE_LABELS = dict(TeamEvent.EventType.choices)
+
+
+def _target_events(team_id: int, now: datetime) -> QuerySet[TeamEvent]:
+    """Return the team's events that may be chosen as a target around ``now``."""
+    return TeamEvent.objects.filter(
+        team_id=team_id, starts_at__gte=now - TARGET_WINDOW, starts_at__lte=now + TARGET_WINDOW
+    )
+
+
+def _target_games(team_id: int, now: datetime) -> QuerySet[Game]:
+    """Return the team's home/away games that may be chosen as a target around ``now``."""
+    return Game.objects.filter(
+        Q(home_team_id=team_id) | Q(away_team_id=team_id),
+        starts_at__gte=now - TARGET_WINDOW,
+        starts_at__lte=now + TARGET_WINDOW,
+    )
+
+
+def _build_target_choices(team_id: int, now: datetime) -> tuple[list[tuple[str, str]], list[tuple[str, str]]]:
+    """Return ``(event_choices, game_choices)`` for the team around ``now``.
+
+    Only the columns needed for the labels are read, so the result is plain
+    tuples that can be cached as-is.
+    """
+    # --- Team events in ±30 days (ascending) ---
+    ev_rows = (
+        _target_events(team_id, now)
+        .order_by("starts_at", "id")
+        .values_list("id", "starts_at", "event_type", "title", "stadium__name")
+    )
+    ev_choices = [
+        (
+            f"E:{pk}",
+            f"{starts_at:%Y-%m-%d %H:%M} • {EVENT_TYPE_LABELS.get(event_type, event_type)} — {title or '—'}"
+            + (f" • {stadium}" if stadium else ""),
+        )
+        for pk, starts_at, event_type, title, stadium in ev_rows
+    ]
+
+    # --- Games in ±30 days (ascending) ---
+    g_rows = (
+        _target_games(team_id, now)
+        .order_by("starts_at", "id")
+        .values_list("id", "starts_at", "home_team__name", "away_team__name", "stadium__name")
+    )
+    g_choices = [
+        (
+            f"G:{pk}",
+            f"{starts_at:%Y-%m-%d %H:%M} • {home} vs {away}" + (f" • {stadium}" if stadium else ""),
+        )
+        for pk, starts_at, home, away, stadium in g_rows
+    ]
+    return ev_choices, g_choices
+
+
+def _cached_target_choices(team_id: int, now: datetime) -> tuple[list[tuple[str, str]], list[tuple[str, str]]]:
+    """Cached :func:`_build_target_choices`, keyed by team and minute bucket."""
+    bucket = int(now.timestamp() // TARGET_CHOICES_TTL)
+    return cache.get_or_set(
+        f"feedback:targets:v1:{team_id}:{bucket}",
+        lambda: _build_target_choices(team_id, now),
+        TARGET_CHOICES_TTL,
+    )
+
+
+def _target_field_choices(team_id: int | None, now: datetime) -> list[Any]:
+    """Return the grouped ``target`` choices for the team (empty groups if none)."""
+    ev_choices: list[tuple[str, str]] = []
+    g_choices: list[tuple[str, str]] = []
+    if team_id:
+        ev_choices, g_choices = _cached_target_choices(team_id, now)
+    return [
+        TARGET_EMPTY_CHOICE,
+        ("Události (±30 dní)", ev_choices),
+        ("Zápasy (±30 dní)", g_choices),
+    ]
+
+
 class ProfileForm(forms.ModelForm):
     """Allow a user to update their e‑mail address.
 
@@ -92,8 +187,9 @@ class FeedbackForm(forms.ModelForm):
         - "Události (±30 dní)": team-bound events within the window.
         - "Zápasy (±30 dní)": games (home/away) within the window.
 
-    Choice values are encoded as ``E:<id>`` or ``G:<id>`` and are later parsed
-    by the view to assign ``related_event`` or ``related_game`` on save.
+    Choice values are encoded as ``E:<id>`` or ``G:<id>``; :meth:`clean_target`
+    parses them into ``(kind, id)`` so the view can assign ``related_event``
+    or ``related_game`` on save.
 
     Attributes set on instances:
         _range_start: ``timezone-aware datetime`` – start of the window.
@@ -103,7 +199,7 @@ class FeedbackForm(forms.ModelForm):
     target = forms.ChoiceField(
         label="Cíl (událost / zápas, nepovinné)",
         required=False,
-        choices=[("", "— vyber událost nebo zápas —")],
+        choices=(TARGET_EMPTY_CHOICE,),
     )
 
     class Meta:
@@ -118,53 +214,44 @@ class FeedbackForm(forms.ModelForm):
         super().__init__(*args, **kwargs)
 
         now = timezone.now()
-        start = now - timedelta(days=30)
-        end = now + timedelta(days=30)
-
-        # --- Team events in ±30 days (ascending) ---
-        ev_qs = TeamEvent.objects.none()
-        if team:
-            ev_qs = (
-                TeamEvent.objects
-                .filter(team=team, starts_at__gte=start, starts_at__lte=end)
-                .select_related("stadium")
-                .order_by("starts_at", "id")
-            )
-
-        # --- Games in ±30 days (ascending) ---
-        g_qs = Game.objects.none()
-        if team:
-            g_qs = (
-                Game.objects
-                .filter(Q(home_team=team) | Q(away_team=team), starts_at__gte=start, starts_at__lte=end)
-                .select_related("home_team", "away_team", "stadium")
-                .order_by("starts_at", "id")
-            )
-
-        # Build choices with opt-groups, keep Czech labels
-        ev_choices = [
-            (
-                f"E:{e.id}",
-                f"{e.starts_at:%Y-%m-%d %H:%M} • {e.get_event_type_display()} — {e.title or '—'}"
-                + (f" • {e.stadium.name}" if e.stadium_id else ""),
-            )
-            for e in ev_qs
-        ]
-        g_choices = [
-            (
-                f"G:{g.id}",
-                f"{g.starts_at:%Y-%m-%d %H:%M} • {g.home_team.name} vs {g.away_team.name}"
-                + (f" • {g.stadium.name}" if g.stadium_id else ""),
-            )
-            for g in g_qs
-        ]
-
-        self.fields["target"].choices = [
-            ("", "— vyber událost nebo zápas —"),
-            ("Události (±30 dní)", ev_choices),
-            ("Zápasy (±30 dní)", g_choices),
-        ]
+        start = now - TARGET_WINDOW
+        end = now + TARGET_WINDOW
+
+        self._team_id = team.pk if team else None
+        self._now = now
+        # Resolved on first use (render or validation), at most once per form,
+        # so a form that is built but never shown runs no queries.
+        self.fields["target"].choices = lru_cache(maxsize=1)(
+            lambda: _target_field_choices(self._team_id, now)
+        )
 
         # Expose the time window for the template (informational)
         self._range_start = start
         self._range_end = end
+
+    def clean_target(self) -> tuple[str, int] | None:
+        """Parse the selected ``E:<id>`` / ``G:<id>`` value and confirm it still exists.
+
+        ``ChoiceField`` has already checked the value against the offered
+        choices, but those are cached for up to a minute; one ``exists()``
+        query makes sure the event/game was not deleted in the meantime, so
+        the view can assign the id without hitting the FK check on save.
+
+        Returns:
+            ``(kind, id)`` with ``kind`` being ``"E"`` or ``"G"``, or ``None``
+            when no target was chosen.
+
+        Raises:
+            forms.ValidationError: If the value is not in the expected format
+                or the target no longer exists.
+        """
+        value = self.cleaned_data.get("target") or ""
+        if not value:
+            return None
+        if not (value[:2] in ("E:", "G:") and value[2:].isdigit() and self._team_id):
+            raise forms.ValidationError("Neplatný cíl připomínky.")
+        kind, target_id = value[0], int(value[2:])
+        targets = _target_events if kind == "E" else _target_games
+        if not targets(self._team_id, self._now).filter(pk=target_id).exists():
+            raise forms.ValidationError("Vybraná událost nebo zápas už neexistuje.")
+        return kind, target_id
@@ -74,12 +74,13 @@ class AccountView(LoginRequiredMixin, TemplateView):
 
         if action == "profile":
             profile_form = ProfileForm(request.POST, instance=user)
-            password_form = PasswordChangeForm(user=user)
             if profile_form.is_valid():
                 profile_form.save()
                 messages.success(request, "E‑mail byl uložen.")
                 return redirect("portal:account")
             else:
+                # The other form is only needed when the page is re-rendered.
+                password_form = PasswordChangeForm(user=user)
                 messages.error(request, "Zkontroluj prosím formulář.")
                 return self.render_to_response(
                     {
@@ -90,7 +91,6 @@ class AccountView(LoginRequiredMixin, TemplateView):
                 )
 
         if action == "password":
-            profile_form = ProfileForm(instance=user)
             password_form = PasswordChangeForm(user=user, data=request.POST)
             if password_form.is_valid():
                 user = password_form.save()
@@ -98,6 +98,7 @@ class AccountView(LoginRequiredMixin, TemplateView):
                 messages.success(request, "Heslo bylo změněno.")
                 return redirect("portal:account")
             else:
+                profile_form = ProfileForm(instance=user)
                 # Surface detailed errors in the global messages area for clarity.
                 for err in password_form.non_field_errors():
                     messages.error(request, err)
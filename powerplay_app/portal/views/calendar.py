@@ -13,7 +13,7 @@ from __future__ import annotations
 from datetime import timedelta
 from typing import Any
 
-from django.db.models import Q
+from django.db.models import Prefetch, Q
 from django.utils import timezone
 from django.views.generic import TemplateView
 
@@ -21,6 +21,19 @@ from powerplay_app.context import _resolve_primary_team
 from powerplay_app.models import TeamEvent
 from powerplay_app.models.games import Game
 
+# Events/games are listed for this long from *now*
+CALENDAR_WINDOW = timedelta(days=30)
+
+# Columns the calendar template renders; ``related_game`` is the FK used by
+# the prefetch of the game's team names.
+CALENDAR_EVENT_FIELDS = (
+    "title",
+    "starts_at",
+    "event_type",
+    "related_game",
+    "stadium__name",
+)
+
 
 class CalendarView(TemplateView):
     """Calendar page for the portal.
@@ -34,8 +47,11 @@ class CalendarView(TemplateView):
     Notes:
         - Time handling stays timezone-aware via ``timezone.now()`` and
           ``timezone.localtime`` in templates where needed.
-        - QuerySets are left lazy; ``exists()`` is used explicitly for fallback
-          branching.
+        - The events queryset is evaluated once for the fallback branching and
+          reused by the template; the related games (with both teams) are
+          prefetched for game events only instead of LEFT JOINed to every row.
+        - Both queries load only the columns the template renders
+          (:data:`CALENDAR_EVENT_FIELDS`).
     """
 
     template_name = "portal/calendar.html"
@@ -51,26 +67,29 @@ class CalendarView(TemplateView):
 
         team = _resolve_primary_team()
         start = timezone.now()
-        end = start + timedelta(days=30)
+        end = start + CALENDAR_WINDOW
 
         events = TeamEvent.objects.none()
         games_fallback = Game.objects.none()
 
         if team:
             # 1) Events directly bound to the team OR to games involving the team.
+            #    The games are matched by an IN subquery (home/away team indexes)
+            #    rather than an OR evaluated across a LEFT JOIN to every event.
+            team_games = Game.objects.filter(Q(home_team=team) | Q(away_team=team)).values("pk")
+            related_games = (
+                Game.objects
+                .select_related("home_team", "away_team")
+                .only("id", "home_team__name", "away_team__name")
+            )
             events = (
                 TeamEvent.objects
-                .select_related(
-                    "team",
-                    "stadium",
-                    "related_game",
-                    "related_game__home_team",
-                    "related_game__away_team",
-                )
+                .select_related("stadium")
+                .prefetch_related(Prefetch("related_game", queryset=related_games))
+                .only(*CALENDAR_EVENT_FIELDS)
                 .filter(
                     Q(team=team)
-                    | Q(event_type=TeamEvent.EventType.GAME, related_game__home_team=team)
-                    | Q(event_type=TeamEvent.EventType.GAME, related_game__away_team=team)
+                    | Q(event_type=TeamEvent.EventType.GAME, related_game__in=team_games)
                 )
                 .filter(starts_at__gte=start, starts_at__lte=end)
                 .order_by("starts_at")
@@ -78,10 +97,10 @@ class CalendarView(TemplateView):
 
             # 2) Fallback: if TeamEvent sync hasn't created event rows yet,
             #    show upcoming games in the same 30-day window.
-            if not events.exists():
+            if not events:
                 games_fallback = (
                     Game.objects
-                    .select_related("home_team", "away_team", "stadium", "league", "tournament")
+                    .select_related("home_team", "away_team", "stadium")
                     .filter(
                         (Q(home_team=team) | Q(away_team=team)),
                         starts_at__gte=start,
@@ -9,16 +9,16 @@ and optionally to a game or a team event.
 
 Context keys:
     - ``primary_team`` – resolved primary team used to scope queries/forms.
-    - ``items`` – feedback queryset ordered by ``-created_at`` with related
-      game/event data selected for display.
+    - ``items`` / ``page_obj`` – current page (``?page=``) of feedback ordered
+      by ``-created_at``, loading only the columns the list renders.
     - ``form`` – submission form pre-scoped by team and exposing optional
       range hints.
     - ``range_start`` / ``range_end`` – optional date bounds supplied by the
       form (if available).
 
 Linking semantics:
-    - ``target`` cleaned value encodes linkage: ``"G:<id>"`` → Game,
-      ``"E:<id>"`` → TeamEvent.
+    - ``target`` is submitted as ``"G:<id>"`` → Game or ``"E:<id>"`` →
+      TeamEvent; the form cleans it to a ``(kind, id)`` tuple.
 
 The view uses Django messages for success/error UX and snapshots the author's
 current display name into the model. UI strings remain Czech; internal docs are
@@ -31,6 +31,7 @@ from typing import Any
 
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core.paginator import Paginator
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import redirect
 from django.views.generic import TemplateView
@@ -40,6 +41,26 @@ from powerplay_app.models.feedback import GameFeedback
 from ..forms import FeedbackForm
 
 
+# Feedback entries listed per page
+FEEDBACK_PAGE_SIZE = 25
+
+# Columns the list template renders (joined rows included)
+FEEDBACK_LIST_FIELDS = (
+    "created_at",
+    "created_by_name",
+    "subject",
+    "message",
+    "related_event__event_type",
+    "related_event__title",
+    "related_event__starts_at",
+    "related_event__stadium__name",
+    "related_game__starts_at",
+    "related_game__home_team__name",
+    "related_game__away_team__name",
+    "related_game__stadium__name",
+)
+
+
 class FeedbackView(LoginRequiredMixin, TemplateView):
     """Portal page for feedback listing and submission."""
 
@@ -55,26 +76,29 @@ class FeedbackView(LoginRequiredMixin, TemplateView):
         ctx = super().get_context_data(**kwargs)
         team = _resolve_primary_team()
 
-        qs = GameFeedback.objects.none()
+        qs = GameFeedback.objects.none().order_by("-created_at")
         if team:
             qs = (
                 GameFeedback.objects
                 .filter(team=team)
                 .select_related(
-                    "related_game",
                     "related_game__home_team",
                     "related_game__away_team",
-                    "related_event",
+                    "related_game__stadium",
                     "related_event__stadium",
                 )
+                .only(*FEEDBACK_LIST_FIELDS)
                 .order_by("-created_at")
             )
 
+        page_obj = Paginator(qs, FEEDBACK_PAGE_SIZE).get_page(self.request.GET.get("page"))
+
         form = FeedbackForm(team=team)
         ctx.update({
             "primary_team": team,
             "current": "feedback",
-            "items": qs,
+            "items": page_obj,
+            "page_obj": page_obj,
             "form": form,
             "range_start": getattr(form, "_range_start", None),
             "range_end": getattr(form, "_range_end", None),
@@ -108,11 +132,13 @@ class FeedbackView(LoginRequiredMixin, TemplateView):
                 ),
             )
 
-            target = cd.get("target") or ""
-            if target.startswith("G:"):
-                obj.related_game_id = int(target.split(":", 1)[1])
-            elif target.startswith("E:"):
-                obj.related_event_id = int(target.split(":", 1)[1])
+            target = cd.get("target")
+            if target:
+                kind, target_id = target
+                if kind == "G":
+                    obj.related_game_id = target_id
+                else:
+                    obj.related_event_id = target_id
 
             obj.save()
             messages.success(request, "Připomínka byla uložena.")
@@ -42,24 +42,31 @@ from decimal import Decimal
 from typing import Any, TYPE_CHECKING
 
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.db.models import Sum
+from django.core.cache import cache
+from django.db.models import Q, Sum
 from django.db.models.functions import Coalesce
 from django.utils import timezone
 from django.views.generic import TemplateView
 
 from powerplay_app.context import _resolve_primary_team
-from powerplay_app.models.wallet import WalletTransaction
+from powerplay_app.models.wallet import WalletTransaction, wallet_years_cache_key
 
 if TYPE_CHECKING:  # import only for typing to avoid runtime coupling
     from powerplay_app.models import Team
 
 
+# Years offered in the filter change only with a new year's first entry
+WALLET_YEARS_TTL = 300
+
+# Categories listed in each of the "top expenses/incomes" boxes
+TOP_CATEGORIES = 5
+
 # Month choices displayed in the UI (Czech labels)
-CZ_MONTHS = [
+CZ_MONTHS = (
     (1, "leden"), (2, "únor"), (3, "březen"), (4, "duben"),
     (5, "květen"), (6, "červen"), (7, "červenec"), (8, "srpen"),
     (9, "září"), (10, "říjen"), (11, "listopad"), (12, "prosinec"),
-]
+)
 
 
 class WalletView(LoginRequiredMixin, TemplateView):
@@ -82,12 +89,21 @@ class WalletView(LoginRequiredMixin, TemplateView):
         """Return all years with any transactions; fallback to current year.
 
         The query uses ``.dates('date', 'year')`` to keep it database-side, then
-        extracts unique years for the filter dropdown.
+        extracts unique years for the filter dropdown. The list is cached per
+        team for :data:`WALLET_YEARS_TTL` seconds; saving or deleting a
+        transaction drops the entry.
         """
         if not team:
             return [timezone.now().year]
-        years = [d.year for d in WalletTransaction.objects.filter(team=team).dates("date", "year")]
-        return years or [timezone.now().year]
+        years = cache.get_or_set(
+            wallet_years_cache_key(team.pk), lambda: self._query_years(team.pk), WALLET_YEARS_TTL
+        )
+        return list(years) or [timezone.now().year]
+
+    @staticmethod
+    def _query_years(team_id: int) -> list[int]:
+        """Return the distinct years with transactions for the team (one query)."""
+        return [d.year for d in WalletTransaction.objects.filter(team_id=team_id).dates("date", "year")]
 
     def _range_for(self, period: str, year: int, month: int) -> tuple[date, date]:
         """Compute an inclusive date range for the given selection.
@@ -142,37 +158,38 @@ class WalletView(LoginRequiredMixin, TemplateView):
         top_inc: list[dict[str, Any]] = []
 
         if team:
-            tx_all = WalletTransaction.objects.filter(team=team).select_related("category")
-
-            # independent total balance (across all records)
-            all_in = tx_all.filter(kind=WalletTransaction.Kind.INCOME).aggregate(
-                s=Coalesce(Sum("amount"), Decimal("0"))
-            )["s"]
-            all_out = tx_all.filter(kind=WalletTransaction.Kind.EXPENSE).aggregate(
-                s=Coalesce(Sum("amount"), Decimal("0"))
-            )["s"]
-            balance_all = (all_in or Decimal("0")) - (all_out or Decimal("0"))
-
-            # filtered window (list + aggregates + TOP)
-            tx_filtered = tx_all.filter(date__gte=since, date__lte=until).order_by("-date", "-id")
-
-            total_in = tx_filtered.filter(kind="in").aggregate(s=Coalesce(Sum("amount"), Decimal("0")))["s"]
-            total_out = tx_filtered.filter(kind="out").aggregate(s=Coalesce(Sum("amount"), Decimal("0")))["s"]
-            balance = (total_in or Decimal("0")) - (total_out or Decimal("0"))
-
-            # TOP categories (expenses / incomes) – top 5
-            top_exp = (
-                tx_filtered.filter(kind="out", category__isnull=False)
-                .values("category__name")
-                .annotate(s=Sum("amount"))
-                .order_by("-s")[:5]
+            tx_all = WalletTransaction.objects.filter(team=team)
+
+            # independent total balance (across all records) and the filtered
+            # window totals, as conditional sums in one aggregate query
+            income = Q(kind=WalletTransaction.Kind.INCOME)
+            expense = Q(kind=WalletTransaction.Kind.EXPENSE)
+            in_window = Q(date__gte=since, date__lte=until)
+            sums = tx_all.aggregate(
+                all_in=Coalesce(Sum("amount", filter=income), Decimal("0")),
+                all_out=Coalesce(Sum("amount", filter=expense), Decimal("0")),
+                total_in=Coalesce(Sum("amount", filter=income & in_window), Decimal("0")),
+                total_out=Coalesce(Sum("amount", filter=expense & in_window), Decimal("0")),
             )
-            top_inc = (
-                tx_filtered.filter(kind="in", category__isnull=False)
-                .values("category__name")
+            balance_all = sums["all_in"] - sums["all_out"]
+            total_in, total_out = sums["total_in"], sums["total_out"]
+            balance = total_in - total_out
+
+            # filtered window (list + TOP); only the listing needs the category
+            tx_filtered = tx_all.filter(in_window).select_related("category").order_by("-date", "-id")
+
+            # TOP categories (expenses / incomes) – top 5 of each kind, split
+            # in Python from one query grouped by (category, kind)
+            category_sums = (
+                tx_filtered.filter(category__isnull=False)
+                .values("category__name", "kind")
                 .annotate(s=Sum("amount"))
-                .order_by("-s")[:5]
+                .order_by("-s")
             )
+            for row in category_sums:
+                top = top_exp if row["kind"] == WalletTransaction.Kind.EXPENSE else top_inc
+                if len(top) < TOP_CATEGORIES:
+                    top.append(row)
         else:
             balance_all = Decimal("0")
 
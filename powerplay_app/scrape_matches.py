@@ -10,8 +10,14 @@ from __future__ import annotations
 
 from typing import Any
 
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from playwright.sync_api import sync_playwright
 
+# Payload preview length printed with ``debug=True``
+DEBUG_PAYLOAD_CHARS = 500
+# Grace period for follow-up API calls after the first matches response
+IDLE_WAIT_MS = 2000
+
 
 # --- Public API ------------------------------------------------------------
 
@@ -22,19 +28,25 @@ def fetch_results_playwright(
     headless: bool = False,
     wait_ms: int = 7000,
     log: bool = True,
+    debug: bool = False,
 ) -> list[dict[str, Any]]:
     """Fetch match results by observing network responses via Playwright.
 
     Navigates to the schedule page and collects data from any response URL
     containing ``"api/matches"``. Handles either a top-level list or an object
-    with a ``"matches"`` key.
+    with a ``"matches"`` key. Other responses are skipped before any logging
+    or decoding.
 
     Args:
         season: Season label used only for logging/compatibility.
         url: Page URL to visit (defaults to the league schedule).
         headless: Whether to run Chromium headlessly. ``False`` by default.
-        wait_ms: Milliseconds to wait after navigation for API calls to finish.
+        wait_ms: Maximum milliseconds to wait for the first matches response;
+            the call returns as soon as it arrives and the network settles
+            (at most :data:`IDLE_WAIT_MS` more).
         log: If ``True``, print Czech diagnostic messages.
+        debug: If ``True``, also print the start of each captured payload
+            (first :data:`DEBUG_PAYLOAD_CHARS` characters).
 
     Returns:
         List of match dictionaries (may be empty if nothing was captured).
@@ -57,10 +69,10 @@ def fetch_results_playwright(
         """
         try:
             resp_url = getattr(response, "url", "")
-            if log:
-                print("📡 Odpověď:", resp_url)
             if "api/matches" not in resp_url:
                 return
+            if log:
+                print("📡 Odpověď:", resp_url)
 
             try:
                 data = response.json()
@@ -69,8 +81,8 @@ def fetch_results_playwright(
                     print("❌ Chyba při dekódování JSON:", e)
                 return
 
-            if log:
-                print("📦 Obsah odpovědi:", data)
+            if debug:
+                print("📦 Obsah odpovědi:", repr(data)[:DEBUG_PAYLOAD_CHARS])
 
             if isinstance(data, list):
                 if log:
@@ -99,9 +111,20 @@ def fetch_results_playwright(
             page = browser.new_page()
             page.on("response", handle_response)
 
-            # Navigate and allow time for XHR/fetch calls to happen.
-            page.goto(url)
-            page.wait_for_timeout(wait_ms)
+            # Navigate and wait for the first matches response instead of a
+            # fixed delay; the listener above still captures every response.
+            try:
+                with page.expect_response(lambda r: "api/matches" in r.url, timeout=wait_ms):
+                    page.goto(url)
+            except PlaywrightTimeoutError:
+                if log:
+                    print(f"⏱️ Odpověď api/matches nedorazila do {wait_ms} ms")
+            else:
+                # Let follow-up calls (e.g. further pages) finish.
+                try:
+                    page.wait_for_load_state("networkidle", timeout=IDLE_WAIT_MS)
+                except PlaywrightTimeoutError:
+                    pass
         finally:
             if browser is not None:
                 browser.close()
@@ -9,23 +9,21 @@ Provided utilities:
     - :func:`player_season_totals_qs` – annotated totals for public FE, based on
       the ``PlayerSeasonTotals`` proxy.
     - :func:`games_for_team` – helper to list a team's games (home/away).
-    - :func:`recompute_game` – recompute game score and per-game ``PlayerStats``
-      from ``Goal``/``Penalty`` events and goalie assignments.
+    - :func:`recompute_game` – recompute per-game ``PlayerStats`` from
+      ``Goal``/``Penalty`` events and goalie assignments (the manually entered
+      game score is left untouched).
 """
 
 from __future__ import annotations
 
+from collections import defaultdict
 from typing import Any
 
-from django.db.models import  F
-
 from django.db.models.query import QuerySet
 
 from django.core.cache import cache
 
-from django.conf import settings
-
-from django.db.models import F, Count, Sum, Value, Q, IntegerField, Subquery, OuterRef
+from django.db.models import Count, Sum, Value, Q
 from django.db.models.functions import Coalesce
 
 from powerplay_app.models.games import GameNomination, GameCompetition
@@ -54,43 +52,17 @@ __all__ = [
 
 
 def player_season_totals_qs(team: Team) -> QuerySet[PlayerSeasonTotals]:
-    base_qs: QuerySet[PlayerSeasonTotals] = PlayerSeasonTotals.objects.filter(team=team)
+    """Return the team's players annotated with their aggregated totals.
 
-    # GP z nominací (distinct game) – samostatný subdotaz
-    gp_sq = (
-        GameNomination.objects
-        .filter(player=OuterRef("pk"))
-        .values("player")
-        .annotate(gp=Count("game", distinct=True))
-        .values("gp")[:1]
-    )
-
-    # Agregace z PlayerStats – jeden „derived“ subquery, ze kterého si vytáhneme 4 hodnoty
-    ps_sq = (
-        PlayerStats.objects
-        .filter(player=OuterRef("pk"))
-        .values("player")
-        .annotate(
-            g=Coalesce(Sum("goals"), 0),
-            a=Coalesce(Sum("assists"), 0),
-            pim=Coalesce(Sum("penalty_minutes"), 0),
-            ga=Coalesce(Sum("goals_against"), 0),
-        )
-    )
-
-    qs = (
-        base_qs
-        .annotate(
-            games_played=Coalesce(Subquery(gp_sq, output_field=IntegerField()), Value(0)),
-            goals=Coalesce(Subquery(ps_sq.values("g")[:1], output_field=IntegerField()), Value(0)),
-            assists=Coalesce(Subquery(ps_sq.values("a")[:1], output_field=IntegerField()), Value(0)),
-            penalty_minutes=Coalesce(Subquery(ps_sq.values("pim")[:1], output_field=IntegerField()), Value(0)),
-            goals_against=Coalesce(Subquery(ps_sq.values("ga")[:1], output_field=IntegerField()), Value(0)),
-        )
-        .annotate(points=F("goals") + F("assists"))
-    )
-    return qs
+    Args:
+        team (Team): Team whose roster should be listed.
 
+    Returns:
+        QuerySet[PlayerSeasonTotals]: Players annotated with ``games_played``,
+        ``goals``, ``assists``, ``points``, ``penalty_minutes`` and
+        ``goals_against``.
+    """
+    return PlayerSeasonTotals.objects.filter(team=team).with_season_totals()
 
 
 def games_for_team(team: Team) -> QuerySet[Game]:
@@ -116,75 +88,103 @@ def games_for_team(team: Team) -> QuerySet[Game]:
     )
 
 
+# Per-game counters rebuilt by :func:`recompute_game`
+_RECOMPUTED_FIELDS = ("goals", "assists", "points", "penalty_minutes", "goals_against")
+
+
 def recompute_game(game: Game) -> None:
-    """Statistics helpers and recomputation routines.
+    """Recompute per-game ``PlayerStats`` from the game's events.
+
+    Goals, assists and penalty minutes come from ``Goal``/``Penalty``; goals
+    against for goalies (line 0, slot G) come from the manual score. GAME SCORE
+    IS NOT TOUCHED (score is the single source of truth).
 
-    Provided utilities:
-        - player_season_totals_qs – annotated totals for public FE.
-        - games_for_team – helper to list a team's games (home/away).
-        - recompute_game – recompute per-game PlayerStats from events; GAME SCORE
-          IS NOT TOUCHED (score is the single source of truth).
+    Notes:
+        Each source is read with one grouped query; missing ``PlayerStats``
+        rows are inserted with a single ``bulk_create`` and only rows whose
+        counters changed are written back with ``bulk_update``, so the number
+        of queries does not grow with the number of players.
     """
 
     home_id = game.home_team_id
-    away_id = game.away_team_id
 
-    # Reset existujících per-game stats
-    PlayerStats.objects.filter(game=game).update(
-        points=0, goals=0, assists=0, penalty_minutes=0, goals_against=0
-    )
+    totals: defaultdict[int, dict[str, int]] = defaultdict(lambda: dict.fromkeys(_RECOMPUTED_FIELDS, 0))
+    goals = Goal.objects.filter(game=game)
 
     # Góly
-    for row in Goal.objects.filter(game=game).values("scorer").annotate(c=Count("id")):
-        if row["scorer"] is None:
-            continue
-        stats, _ = PlayerStats.objects.get_or_create(player_id=row["scorer"], game=game)
-        stats.goals = row["c"]
-        stats.points = (stats.goals or 0) + (stats.assists or 0)
-        stats.save(update_fields=["goals", "points"])
+    goal_qs = (
+        goals.filter(scorer__isnull=False)
+        .values("scorer")
+        .annotate(c=Count("id"))
+        .values_list("scorer", "c")
+    )
+    for pid, c in goal_qs:
+        totals[pid]["goals"] = c
 
     # Asistence (primární + sekundární)
     for field in ("assist_1", "assist_2"):
         assist_qs = (
-            Goal.objects.filter(game=game, **{f"{field}__isnull": False})
+            goals.filter(**{f"{field}__isnull": False})
             .values(field)
             .annotate(c=Count("id"))
+            .values_list(field, "c")
         )
-        for row in assist_qs:
-            pid = row[field]
-            if pid is None:
-                continue
-            stats, _ = PlayerStats.objects.get_or_create(player_id=pid, game=game)
-            stats.assists = (stats.assists or 0) + row["c"]
-            stats.points = (stats.goals or 0) + (stats.assists or 0)
-            stats.save(update_fields=["assists", "points"])
+        for pid, c in assist_qs:
+            totals[pid]["assists"] += c
 
     # Trestné minuty
-    for row in Penalty.objects.filter(game=game).values("penalized_player").annotate(mins=Sum("minutes")):
-        pid = row["penalized_player"]
-        if pid is None:
-            continue
-        stats, _ = PlayerStats.objects.get_or_create(player_id=pid, game=game)
-        stats.penalty_minutes = int(row.get("mins") or 0)
-        stats.save(update_fields=["penalty_minutes"])
+    pim_qs = (
+        Penalty.objects.filter(game=game, penalized_player__isnull=False)
+        .values("penalized_player")
+        .annotate(mins=Sum("minutes"))
+        .values_list("penalized_player", "mins")
+    )
+    for pid, mins in pim_qs:
+        totals[pid]["penalty_minutes"] = int(mins or 0)
 
     # Goals Against pro gólmany (line 0, slot G) – z RUČNÍHO skóre
     goalies = (
         LineAssignment.objects
-        .filter(line__game=game, line__line_number=0, slot=LineSlot.G)
-        .select_related("player", "line__team")
+        .filter(
+            line__game=game, line__line_number=0, slot=LineSlot.G, player__position=Player.Position.GOALIE
+        )
+        .values_list("player_id", "line__team_id")
     )
-    for la in goalies:
-        player: Player | None = getattr(la, "player", None)
-        if not player or player.position != "goalie":
-            continue
-        conceded = game.score_away if la.line.team_id == home_id else game.score_home
-        stats, _ = PlayerStats.objects.get_or_create(player=player, game=game)
-        stats.goals_against = int(conceded or 0)
-        stats.save(update_fields=["goals_against"])
+    for pid, team_id in goalies:
+        conceded = game.score_away if team_id == home_id else game.score_home
+        totals[pid]["goals_against"] = int(conceded or 0)
+
+    for row in totals.values():
+        row["points"] = row["goals"] + row["assists"]
+
+    # Reset existujících per-game stats + zápis nových hodnot
+    existing = {
+        ps.player_id: ps
+        for ps in PlayerStats.objects.filter(game=game).only("id", "player_id", *_RECOMPUTED_FIELDS)
+    }
+    zero = dict.fromkeys(_RECOMPUTED_FIELDS, 0)
+    changed: list[PlayerStats] = []
+    for pid, stats in existing.items():
+        values = totals.get(pid, zero)
+        if any(getattr(stats, f) != values[f] for f in _RECOMPUTED_FIELDS):
+            for f in _RECOMPUTED_FIELDS:
+                setattr(stats, f, values[f])
+            changed.append(stats)
+    if changed:
+        PlayerStats.objects.bulk_update(changed, _RECOMPUTED_FIELDS, batch_size=500)
+
+    missing = [PlayerStats(game=game, player_id=pid, **row) for pid, row in totals.items() if pid not in existing]
+    if missing:
+        PlayerStats.objects.bulk_create(
+            missing,
+            batch_size=500,
+            update_conflicts=True,
+            unique_fields=("player", "game"),
+            update_fields=_RECOMPUTED_FIELDS,
+        )
 
     # Invalidační úklid cache souhrnů (bezpečně pro dotčené hráče + možné ligy)
-    affected_player_ids = list(PlayerStats.objects.filter(game=game).values_list("player_id", flat=True))
+    affected_player_ids = existing.keys() | totals.keys()
     possible_leagues = {
         game.league_id,
         getattr(game.home_team, "league_id", None),
@@ -278,7 +278,7 @@ def get_player_totals_from_playerstats(
     pts = g + a
 
     # výsledek podle pozice
-    if getattr(player, "position", "") == "goalie":
+    if getattr(player, "is_goalie", False):
         data = {"gp": gp, "ga": ga, "g": g, "a": a, "pim": pim}
     else:
         data = {"gp": gp, "g": g, "a": a, "pts": pts, "pim": pim}
@@ -309,9 +309,6 @@ def invalidate_player_totals_cache(player_ids: list[int] | set[int],
 
 
 def cached_player_totals(player: Player, *, season_league: League | None, competitions: str) -> dict:
-    if getattr(settings, "DEBUG", False):
-        return get_player_totals_from_playerstats(player, season_league=season_league, competitions=competitions)
-
     lid = getattr(season_league, "id", "none")
     key = _totals_cache_key(player.id, lid, (competitions or "league").lower())
     return cache.get_or_set(
@@ -49,7 +49,7 @@ class ContactView(TemplateView):
         if team:
             staff_qs = (
                 Staff.objects.filter(team=team, is_active=True)
-                .select_related("team")
+                .list_view()
                 .order_by("order", "last_name", "first_name")
             )
 
@@ -54,15 +54,14 @@ def _build_rink_lines(game: Game, team: Team):
 
 
 def _primary_goalie(game: Game, team: Team):
-    gline = (
-        Line.objects.filter(game=game, team=team, line_number=0)
-        .prefetch_related("players__player")
+    a = (
+        LineAssignment.objects.filter(
+            game=game, line__team=team, line__line_number=0, slot=LineSlot.G, player__isnull=False
+        )
+        .select_related("player")
         .first()
     )
-    if not gline:
-        return None
-    a = gline.players.filter(slot=LineSlot.G).select_related("player").first()
-    return a.player if a and a.player_id else None
+    return a.player if a else None
 
 
 class GameDetailView(DetailView):
@@ -9,8 +9,9 @@ Notes
 -----
 * Competition filter uses ?cmp=league|tournament|friendly|all
 * Season window is taken from resolve_season_window(team) if a league exists
-* PIM in per-game rows is taken from PlayerStats.minutes; when empty/0 we
-  fallback to sum of Penalty.minutes for that player in the game.
+* PIM in per-game rows is taken from PlayerStats.penalty_minutes; when 0 we
+  fallback to sum of Penalty.minutes for that player in the game (one grouped
+  query for all rows).
 * GA in per-game rows supports `ga` or `goals_against` field names
 """
 
@@ -23,7 +24,7 @@ from django.db.models import Count, Sum
 from django.views.generic import DetailView, TemplateView
 
 from powerplay_app.context import _resolve_primary_team
-from powerplay_app.models import Player, PlayerStats
+from powerplay_app.models import Penalty, Player, PlayerStats
 from powerplay_app.services.stats import resolve_season_window, cached_player_totals
 
 
@@ -126,7 +127,22 @@ class PlayerDetailView(DetailView):
             if cmp != "all":
                 qs = qs.filter(game__competition=cmp)
 
-            for st in qs:
+            stats_rows = list(qs)
+
+            # Penalty fallback for rows without stored PIM, grouped per game
+            no_pim_games = [st.game_id for st in stats_rows if not st.pim]
+            penalty_pim: dict[int, int] = {}
+            if no_pim_games:
+                penalty_pim = dict(
+                    Penalty.objects.filter(
+                        game_id__in=no_pim_games, penalized_player_id=p.id, team_id=p.team_id
+                    )
+                    .values("game_id")
+                    .annotate(total=Sum("minutes"))
+                    .values_list("game_id", "total")
+                )
+
+            for st in stats_rows:
                 g = st.game
                 if not g:
                     continue
@@ -147,14 +163,8 @@ class PlayerDetailView(DetailView):
                 g_val = getattr(st, "goals", 0) or 0
                 a_val = getattr(st, "assists", 0) or 0
 
-                # --- PIM: prefer PlayerStats.minutes; if empty/0, sum Penalty.minutes for this game/player
-                minutes = getattr(st, "minutes", None)
-                pim_val = minutes if minutes not in (None, 0) else (
-                    g.penalty_set.filter(
-                        penalized_player_id=p.id,
-                        team_id=p.team_id,
-                    ).aggregate(total=Sum("minutes"))["total"] or 0
-                )
+                # --- PIM: prefer PlayerStats.penalty_minutes; if 0, sum Penalty.minutes for this game/player
+                pim_val = st.pim or penalty_pim.get(st.game_id) or 0
 
                 # --- GA může být `ga` nebo `goals_against`
                 ga_val = getattr(st, "ga", None)
@@ -183,7 +193,7 @@ class PlayerDetailView(DetailView):
         ctx.update(
             {
                 "age": _age(p.birth_date),
-                "is_goalie": (p.position == "goalie"),
+                "is_goalie": p.is_goalie,
                 "stats": totals,
                 "season_meta": {
                     "league": season_league,
@@ -42,7 +42,7 @@ class StaffListView(TemplateView):
             qs = (
                 Staff.objects
                 .filter(team=team, is_active=True)
-                .select_related("team")
+                .list_view()
                 .order_by("order", "last_name", "first_name")
             )
             debug = {
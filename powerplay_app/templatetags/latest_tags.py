@@ -19,6 +19,7 @@ from django.utils import timezone
 from django.urls import reverse
 from django.utils.text import slugify
 
+from powerplay_app.models.core import stored_file_url
 from powerplay_app.models.games import Game, GameCompetition
 
 register = template.Library()
@@ -69,14 +70,12 @@ def _team_logo_url(team: Any) -> Optional[str]:
     if isinstance(val, str) and val.strip():
         return val
     # ImageField
-    img = getattr(team, "logo", None)
-    if img is not None:
-        try:
-            url = img.url  # type: ignore[attr-defined]
-            if isinstance(url, str) and url.strip():
-                return url
-        except Exception:
-            pass
+    try:
+        url = stored_file_url(team, "logo")
+        if url:
+            return url
+    except Exception:
+        pass
     # běžné aliasy
     for attr in ("emblem", "badge"):
         img2 = getattr(team, attr, None)
@@ -22,6 +22,7 @@ from django.urls import reverse
 from django.utils.text import slugify
 
 # Explicit import to avoid relying on packages' __init__ exports
+from powerplay_app.models.core import stored_file_url
 from powerplay_app.models.games import Game, GameCompetition
 
 register = template.Library()
@@ -73,14 +74,12 @@ def _team_logo_url(team: Any) -> Optional[str]:
     if isinstance(val, str) and val.strip():
         return val
     # ImageField-like (may raise when storage is misconfigured, be safe)
-    img = getattr(team, "logo", None)
-    if img is not None:
-        try:
-            url = img.url  # type: ignore[attr-defined]
-            if isinstance(url, str) and url.strip():
-                return url
-        except Exception:
-            pass
+    try:
+        url = stored_file_url(team, "logo")
+        if url:
+            return url
+    except Exception:
+        pass
     # Common aliases just in case
     for attr in ("emblem", "badge"):
         img2 = getattr(team, attr, None)
@@ -13,7 +13,9 @@ Test coverage in this module:
 * GameAdmin utilities for ensuring/generating default lines.
 * GameAdminForm field labels and initial nomination population.
 * Inlines (Goal/Penalty) foreign key queryset restrictions.
+* Line inlines rejecting one player submitted into two lines.
 * Actions for regenerating calendar events and syncing league results.
+* GameFeedbackAdmin deferring the message body on the changelist page only.
 * Custom admin list filter matching team or related game on TeamEvent.
 """
 
@@ -286,6 +288,72 @@ def test_penalty_inline_foreignkeys_filtered() -> None:
     assert ids == {hp.id, ap.id}
 
 
+# --- Line inlines: one player per game ------------------------------------
+
+
+def _bound_skater_lines(game: Any, players_by_line: list[Any]) -> Any:
+    """Bind the home skater-lines formset with one nested formset per line.
+
+    ``players_by_line[i]`` is put into the first slot of the ``i``-th line,
+    mirroring a single change-form submit that fills several lines at once.
+    """
+    Game = apps.get_model("powerplay_app", "Game")
+    Line = apps.get_model("powerplay_app", "Line")
+
+    from powerplay_app.admin import HomeSkaterLinesInline, SkaterLineAssignmentInline
+
+    req = make_request()
+    lines_inline = HomeSkaterLinesInline(Game, admin.site)
+    LineFormSet = lines_inline.get_formset(req, obj=game)
+    lines = list(lines_inline.get_queryset(req))
+
+    data: dict[str, Any] = {
+        "lines-TOTAL_FORMS": str(len(lines)),
+        "lines-INITIAL_FORMS": str(len(lines)),
+        "lines-MIN_NUM_FORMS": "0",
+        "lines-MAX_NUM_FORMS": "1000",
+    }
+    for i, line in enumerate(lines):
+        data.update({f"lines-{i}-id": line.pk, f"lines-{i}-game": game.pk, f"lines-{i}-line_number": line.line_number})
+    formset = LineFormSet(data=data, instance=game, prefix="lines", queryset=lines_inline.get_queryset(req))
+
+    AssignmentFormSet = SkaterLineAssignmentInline(Line, admin.site).get_formset(req, obj=lines[0])
+    for i, (form, player) in enumerate(zip(formset.forms, players_by_line)):
+        prefix = f"players-{i}"
+        nested_data = {
+            f"{prefix}-TOTAL_FORMS": "5",
+            f"{prefix}-INITIAL_FORMS": "0",
+            f"{prefix}-MIN_NUM_FORMS": "0",
+            f"{prefix}-MAX_NUM_FORMS": "5",
+            f"{prefix}-0-player": player.pk,
+        }
+        form.nested_formsets = [AssignmentFormSet(data=nested_data, instance=form.instance, prefix=prefix)]
+    return formset
+
+
+def test_skater_lines_formset_rejects_player_in_two_lines() -> None:
+    """One submit placing the same player into two lines fails validation, not on INSERT."""
+    Game = apps.get_model("powerplay_app", "Game")
+    GameNomination = apps.get_model("powerplay_app", "GameNomination")
+    Player = apps.get_model("powerplay_app", "Player")
+    _, home, _, game = setup_league_team_game()
+
+    from powerplay_app.admin import GameAdmin
+
+    GameAdmin(Game, admin.site)._ensure_default_lines(game)
+    p1 = Player.objects.create(first_name="Dvo", last_name="Jitý", jersey_number=7, position="forward", team=home)
+    p2 = Player.objects.create(first_name="Jiný", last_name="Hráč", jersey_number=8, position="forward", team=home)
+    GameNomination.objects.create(game=game, team=home, player=p1)
+    GameNomination.objects.create(game=game, team=home, player=p2)
+
+    duplicate = _bound_skater_lines(game, [p1, p1])
+    assert not duplicate.is_valid()
+    assert any("jen do jedné lajny" in e for e in duplicate.non_form_errors())
+
+    distinct = _bound_skater_lines(game, [p1, p2])
+    assert distinct.is_valid(), distinct.non_form_errors()
+
+
 # --- regenerate_calendar_events action -----------------------------------
 
 
@@ -363,6 +431,32 @@ def test_league_admin_sync_results_requires_single_selection() -> None:
     assert msgs and "Vyber přesně jednu ligu" in msgs[0][0]
 
 
+# --- GameFeedbackAdmin.get_queryset --------------------------------------
+
+
+def test_feedback_admin_defers_message_on_changelist_page_only() -> None:
+    """The changelist GET skips ``message``; other views and action POSTs load it."""
+    import types
+
+    GameFeedback = apps.get_model("powerplay_app", "GameFeedback")
+
+    from powerplay_app.admin import GameFeedbackAdmin
+
+    fa = GameFeedbackAdmin(GameFeedback, admin.site)
+
+    def deferred(method: str, url_name: str) -> set[str]:
+        req = make_request()
+        req.method = method
+        req.resolver_match = types.SimpleNamespace(url_name=url_name)
+        names, is_defer = fa.get_queryset(req).query.deferred_loading
+        return set(names) if is_defer else set()
+
+    assert deferred("GET", "powerplay_app_gamefeedback_changelist") == {"message"}
+    assert deferred("POST", "powerplay_app_gamefeedback_changelist") == set()  # e.g. delete_selected
+    assert deferred("GET", "powerplay_app_gamefeedback_change") == set()
+    assert deferred("GET", "powerplay_app_gamefeedback_delete") == set()
+
+
 # --- TeamEventAdmin.TeamAnyFilter ----------------------------------------
 
 
@@ -38,6 +38,21 @@ def test_league_autofills_season_when_blank(League: Any) -> None:
     assert league.season == "2025/2026"
 
 
+def test_league_autofilled_season_survives_update_fields(League: Any) -> None:
+    """A derived ``season`` is persisted even when ``update_fields`` is narrow."""
+    league = League.objects.create(
+        name="Liga UF",
+        season="2024/2025",
+        date_start=dt.date(2025, 8, 1),
+        date_end=dt.date(2026, 5, 1),
+    )
+    league.season = ""
+    league.name = "Liga UF 2"
+    league.save(update_fields=["name"])
+    league.refresh_from_db()
+    assert (league.name, league.season) == ("Liga UF 2", "2025/2026")
+
+
 def test_league_clean_rejects_end_before_start(League: Any) -> None:
     """Reject leagues where ``date_end`` is earlier than ``date_start``."""
     league = League(
@@ -223,3 +223,174 @@ def test_penalty_requires_player_from_team_and_nomination(
     p_bad = Penalty(game=game, team=home, period=1, second_in_period=42, penalized_player=other, minutes=2)
     with pytest.raises(ValidationError):
         p_bad.full_clean()
+
+
+def test_event_validation_cache_reads_nominations_once_per_game(
+    Team: Any, Player: Any, league_min: Any, django_assert_num_queries: Any
+) -> None:
+    """Inside the cache scope, nomination checks hit the DB once per game."""
+    from powerplay_app.models.events import _nominated_among, event_validation_cache
+
+    game, home, _ = _mk_game_basic(Team, league_min)
+    p1 = Player.objects.create(first_name="N", last_name="1", jersey_number=21, position="forward", team=home)
+    p2 = Player.objects.create(first_name="N", last_name="2", jersey_number=22, position="forward", team=home)
+    GameNomination = apps.get_model("powerplay_app", "GameNomination")
+    GameNomination.objects.create(game=game, player=p1, team=home)
+
+    with event_validation_cache():
+        with django_assert_num_queries(1):
+            assert _nominated_among(game.id, [p1.id]) == {p1.id}
+            assert _nominated_among(game.id, [p2.id]) == set()
+            assert _nominated_among(game.id, [p1.id, p2.id]) == {p1.id}
+
+    # Outside the scope all players are checked with one query per call
+    with django_assert_num_queries(1):
+        assert _nominated_among(game.id, [p1.id, p2.id]) == {p1.id}
+
+
+def test_event_validation_cache_counts_goals_per_team_once(
+    Team: Any, Player: Any, league_min: Any, django_assert_num_queries: Any
+) -> None:
+    """Cached goal counts match the COUNT query and exclude the goal itself."""
+    from powerplay_app.models.events import _other_goal_count, event_validation_cache
+
+    game, home, away = _mk_game_basic(Team, league_min)
+    scorer = Player.objects.create(first_name="G", last_name="1", jersey_number=23, position="forward", team=home)
+    Goal = apps.get_model("powerplay_app", "Goal")
+    g1 = Goal.objects.create(game=game, team=home, period=1, second_in_period=50, scorer=scorer)
+    Goal.objects.create(game=game, team=home, period=1, second_in_period=60, scorer=scorer)
+
+    with event_validation_cache([game.id]):
+        with django_assert_num_queries(0):
+            assert _other_goal_count(game.id, home.id, None) == 2
+            assert _other_goal_count(game.id, home.id, g1.pk) == 1
+            assert _other_goal_count(game.id, away.id, None) == 0
+
+    assert _other_goal_count(game.id, home.id, g1.pk) == 1
+
+
+def test_goal_score_limit_uses_attached_game_or_header_columns(
+    Team: Any, Player: Any, league_min: Any
+) -> None:
+    """Score limit reads an attached (possibly unsaved) game, else the DB header."""
+    game, home, _ = _mk_game_basic(Team, league_min)
+    scorer = Player.objects.create(first_name="L", last_name="1", jersey_number=24, position="forward", team=home)
+    GameNomination = apps.get_model("powerplay_app", "GameNomination")
+    GameNomination.objects.create(game=game, player=scorer, team=home)
+    Goal = apps.get_model("powerplay_app", "Goal")
+
+    # Stored score is 0:0 → goal loaded by id only exceeds the limit
+    with pytest.raises(ValidationError):
+        Goal(game_id=game.id, team=home, period=1, second_in_period=70, scorer=scorer).full_clean()
+
+    # Unsaved score edit on the attached game is honoured
+    game.score_home = 1
+    Goal(game=game, team=home, period=1, second_in_period=71, scorer=scorer).full_clean()
+
+
+def test_goal_clean_resolves_player_teams_in_one_query(
+    Team: Any, Player: Any, league_min: Any, django_assert_num_queries: Any
+) -> None:
+    """Scorer/assist teams given by id are read together, not per descriptor."""
+    from powerplay_app.models.events import event_validation_cache
+
+    game, home, _ = _mk_game_basic(Team, league_min)
+    game.score_home = 1
+    game.save()
+    GameNomination = apps.get_model("powerplay_app", "GameNomination")
+    pids = []
+    for num in (25, 26, 27):
+        p = Player.objects.create(first_name="Q", last_name=str(num), jersey_number=num, position="forward", team=home)
+        GameNomination.objects.create(game=game, player=p, team=home)
+        pids.append(p.id)
+    Goal = apps.get_model("powerplay_app", "Goal")
+    g = Goal(game_id=game.id, team_id=home.id, period=1, second_in_period=80,
+             scorer_id=pids[0], assist_1_id=pids[1], assist_2_id=pids[2])
+
+    with event_validation_cache([game.id]):
+        with django_assert_num_queries(1):
+            g.clean()
+
+
+def test_event_clock_formats_minutes_and_seconds() -> None:
+    """``clock`` renders ``m:ss`` and treats a missing time as ``0:00``."""
+    Goal = apps.get_model("powerplay_app", "Goal")
+    assert Goal(second_in_period=605).clock == "10:05"
+    assert Goal(second_in_period=None).clock == "0:00"
+
+
+def test_base_clean_rejects_foreign_team_even_when_nominated(
+    Team: Any, Player: Any, league_min: Any
+) -> None:
+    """The base check rejects a non-participating team on its own."""
+    game, _, _ = _mk_game_basic(Team, league_min)
+    third = Team.objects.create(league=league_min, name="HC Third EVT 2")
+    p = Player.objects.create(first_name="T", last_name="3", jersey_number=28, position="forward", team=third)
+    GameNomination = apps.get_model("powerplay_app", "GameNomination")
+    GameNomination.objects.bulk_create([GameNomination(game=game, player=p, team=third)])
+    Penalty = apps.get_model("powerplay_app", "Penalty")
+    with pytest.raises(ValidationError, match="účastníkem"):
+        Penalty(game=game, team=third, period=1, second_in_period=90, penalized_player=p, minutes=2).clean()
+
+
+def test_event_labels_match_get_display() -> None:
+    """Cached label properties agree with Django's ``get_<field>_display``."""
+    Goal = apps.get_model("powerplay_app", "Goal")
+    Penalty = apps.get_model("powerplay_app", "Penalty")
+    g = Goal(period=Period.OT, strength=Strength.PP)
+    p = Penalty(period=Period.FIRST, penalty_type=PenaltyType.MAJOR)
+    assert g.period_label == g.get_period_display() == "Prodloužení"
+    assert g.strength_label == g.get_strength_display() == "Přesilovka"
+    assert p.penalty_type_label == p.get_penalty_type_display() == "Velký trest (5)"
+
+
+def test_bulk_clean_shares_lookups_and_counts_batch_goals(
+    Team: Any, Player: Any, league_min: Any, django_assert_num_queries: Any
+) -> None:
+    """``bulk_clean`` uses one query per lookup and applies the score limit batch-wide."""
+    game, home, away = _mk_game_basic(Team, league_min)
+    game.score_home = 2
+    game.save()
+    GameNomination = apps.get_model("powerplay_app", "GameNomination")
+    scorer = Player.objects.create(first_name="B", last_name="1", jersey_number=31, position="forward", team=home)
+    other = Player.objects.create(first_name="B", last_name="2", jersey_number=32, position="forward", team=away)
+    GameNomination.objects.create(game=game, player=scorer, team=home)
+    GameNomination.objects.create(game=game, player=other, team=away)
+    Goal = apps.get_model("powerplay_app", "Goal")
+    goals = [
+        Goal(game_id=game.id, team_id=home.id, period=1, second_in_period=sec, scorer_id=scorer.id)
+        for sec in (100, 200, 300)
+    ]
+    goals.append(Goal(game_id=game.id, team_id=home.id, period=2, second_in_period=10, scorer_id=other.id))
+
+    # nominations, goals, game headers, player teams
+    with django_assert_num_queries(4):
+        errors = Goal.bulk_clean(goals)
+
+    assert sorted(errors) == [2, 3]  # third home goal exceeds 2, foreign scorer rejected
+
+
+def test_goal_assist_rules_enforced_by_database(Team: Any, Player: Any, league_min: Any) -> None:
+    """Check constraints reject scorer-as-assist rows that bypass ``clean()``."""
+    from django.db import IntegrityError, transaction
+
+    game, home, _ = _mk_game_basic(Team, league_min)
+    scorer = Player.objects.create(first_name="D", last_name="1", jersey_number=33, position="forward", team=home)
+    a1 = Player.objects.create(first_name="D", last_name="2", jersey_number=34, position="forward", team=home)
+    Goal = apps.get_model("powerplay_app", "Goal")
+
+    Goal.objects.create(game=game, team=home, period=1, second_in_period=5, scorer=scorer, assist_1=a1)
+    for bad in ({"assist_1": scorer}, {"assist_1": a1, "assist_2": a1}):
+        with pytest.raises(IntegrityError), transaction.atomic():
+            Goal.objects.create(game=game, team=home, period=1, second_in_period=6, scorer=scorer, **bad)
+
+
+def test_goal_clean_rejects_assist_conflict_without_queries(
+    Team: Any, Player: Any, league_min: Any, django_assert_num_queries: Any
+) -> None:
+    """Scorer listed as assist fails before any database lookup."""
+    game, home, _ = _mk_game_basic(Team, league_min)
+    Goal = apps.get_model("powerplay_app", "Goal")
+    g = Goal(game_id=game.id, team_id=home.id, period=1, second_in_period=7, scorer_id=1, assist_1_id=1)
+    with django_assert_num_queries(0), pytest.raises(ValidationError):
+        g.clean()
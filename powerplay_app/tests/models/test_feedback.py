@@ -6,13 +6,15 @@ Covers:
 - ``team`` is required at the DB layer.
 - Author display name snapshot remains stable when the user changes.
 - ``__str__`` includes team, subject preview, and a fallback target label.
+- Team name snapshot is filled on save, follows team reassignment, and keeps
+  ``__str__`` query-free.
 
 Internal docs are English; Czech strings remain in assertions where applicable.
 """
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import pytest
 from django.apps import apps
@@ -106,3 +108,43 @@ def test_feedback_str_contains_team_subject_and_target(league_min: "League") ->
     assert team.name in s
     assert "Dotaz" in s
     assert "bez vazby" in s  # fallback když není game ani event
+
+
+def test_feedback_str_uses_team_name_snapshot(
+    league_min: "League", django_assert_num_queries: Any
+) -> None:
+    """The team name is snapshotted on save and ``__str__`` needs no query."""
+    GameFeedback = apps.get_model("powerplay_app", "GameFeedback")
+    team = _mk_team("HC FB4", league_min)
+
+    fb = GameFeedback.objects.create(team_id=team.id, message="Bez předmětu")
+    assert fb.team_name == "HC FB4"
+
+    fresh = GameFeedback.objects.get(pk=fb.pk)
+    with django_assert_num_queries(0):
+        label = str(fresh)
+    assert label.startswith("[HC FB4] Bez předmětu")
+
+
+def test_feedback_team_name_snapshot_follows_reassignment(
+    league_min: "League", django_assert_num_queries: Any
+) -> None:
+    """Moving feedback to another team refreshes the snapshot used by ``__str__``."""
+    GameFeedback = apps.get_model("powerplay_app", "GameFeedback")
+    old = _mk_team("HC Staré", league_min)
+    new = _mk_team("HC Nové", league_min)
+    fb = GameFeedback.objects.create(team=old, subject="Přesun", message="msg")
+
+    fresh = GameFeedback.objects.get(pk=fb.pk)
+    fresh.team_id = new.id
+    fresh.save(update_fields=["team"])
+
+    reloaded = GameFeedback.objects.get(pk=fb.pk)
+    assert reloaded.team_name == "HC Nové"
+    assert str(reloaded).startswith("[HC Nové] Přesun")
+
+    # A plain re-save keeps the snapshot and needs no extra lookup.
+    reloaded.subject = "Přesun 2"
+    with django_assert_num_queries(1):
+        reloaded.save()
+    assert GameFeedback.objects.get(pk=fb.pk).team_name == "HC Nové"
@@ -148,6 +148,26 @@ def test_game_league_date_must_be_within_season(Team: Any, league_min: Any) -> N
         g_out.full_clean()
 
 
+def test_game_clean_with_ids_only_reads_teams_and_bounds_once(
+    Team: Any, league_min: Any, django_assert_num_queries: Any
+) -> None:
+    """Resolve both team leagues in one query and the season bounds in another."""
+    Game = apps.get_model("powerplay_app", "Game")
+    home = Team.objects.create(league=league_min, name="HC H3")
+    away = Team.objects.create(league=league_min, name="HC A3")
+
+    g = Game(
+        starts_at=_aware(2025, 7, 1),
+        home_team_id=home.pk,
+        away_team_id=away.pk,
+        competition=GameCompetition.LEAGUE,
+        league_id=league_min.pk,
+    )
+    with django_assert_num_queries(2), pytest.raises(ValidationError) as exc:
+        g.clean()
+    assert "starts_at" in exc.value.message_dict
+
+
 def test_game_friendly_forbids_league_or_tournament(
     Team: Any, league_min: Any
 ) -> None:
@@ -293,6 +313,36 @@ def test_nomination_autofills_team_from_player_on_save(
     nom.full_clean()
 
 
+def test_nomination_autofills_team_from_player_id_only(
+    Player: Any, Team: Any, league_min: Any
+) -> None:
+    """Autofill ``team`` when only ``player_id`` is set (no cached player)."""
+    game, _, away = _mk_game_basic(Team, league_min)
+    p = Player.objects.create(first_name="C", last_name="D", jersey_number=4, position="forward", team=away)
+    GameNomination = apps.get_model("powerplay_app", "GameNomination")
+    nom = GameNomination(game=game, player_id=p.pk)
+    nom.save()
+    nom.refresh_from_db()
+    assert nom.team_id == away.pk
+
+
+def test_nomination_bulk_nominate_two_queries(
+    Player: Any, Team: Any, league_min: Any, django_assert_num_queries: Any
+) -> None:
+    """Bulk-nominate with teams from players and skip existing nominations."""
+    game, home, away = _mk_game_basic(Team, league_min)
+    p1 = Player.objects.create(first_name="E", last_name="F", jersey_number=5, position="forward", team=home)
+    p2 = Player.objects.create(first_name="G", last_name="H", jersey_number=6, position="forward", team=away)
+    GameNomination = apps.get_model("powerplay_app", "GameNomination")
+    GameNomination.objects.create(game=game, player=p1, team=home)
+
+    with django_assert_num_queries(2):
+        GameNomination.bulk_nominate(game.pk, [p1.pk, p2.pk])
+
+    teams = dict(GameNomination.objects.filter(game=game).values_list("player_id", "team_id"))
+    assert teams == {p1.pk: home.pk, p2.pk: away.pk}
+
+
 def test_nomination_unique_game_player(
     Player: Any, Team: Any, league_min: Any
 ) -> None:
@@ -387,3 +437,30 @@ def test_assignment_same_player_cannot_be_in_multiple_lines_in_same_game(
     la = LineAssignment(line=line2, player=p, slot=LineSlot.C)
     with pytest.raises(ValidationError):
         la.full_clean()
+
+
+def test_assignment_game_synced_and_enforced_by_constraint(
+    Player: Any, Team: Any, league_min: Any
+) -> None:
+    """Mirror ``line.game`` on save and reject per-game duplicates in the DB."""
+    game, home, _ = _mk_game_basic(Team, league_min)
+    Line = apps.get_model("powerplay_app", "Line")
+    line1 = Line.objects.create(game=game, team=home, line_number=1)
+    line2 = Line.objects.create(game=game, team=home, line_number=2)
+    p = Player.objects.create(first_name="D", last_name="B", jersey_number=9, position="forward", team=home)
+
+    LineAssignment = apps.get_model("powerplay_app", "LineAssignment")
+    first = LineAssignment.objects.create(line=line1, player=p, slot=LineSlot.LW)
+    assert first.game_id == game.pk
+
+    # Empty slots are not subject to the constraint
+    LineAssignment.objects.create(line=line1, slot=LineSlot.C)
+    LineAssignment.objects.create(line=line2, slot=LineSlot.C)
+
+    # Forms exclude the non-editable ``game``; the constraint is still checked
+    dup = LineAssignment(line=line2, player=p, slot=LineSlot.RW)
+    with pytest.raises(ValidationError):
+        dup.full_clean(exclude=["game"])
+
+    with pytest.raises(IntegrityError):
+        LineAssignment.objects.create(line=line2, player=p, slot=LineSlot.RW)
@@ -77,6 +77,20 @@ def test_ends_after_starts_validation(Team: Any, league_min: Any) -> None:
         ev.full_clean()
 
 
+def test_ends_before_start_rejected_by_db_on_bulk_create(Team: Any, league_min: Any) -> None:
+    """The check constraint guards bulk inserts; equal start/end stays allowed."""
+    TeamEvent = apps.get_model("powerplay_app", "TeamEvent")
+    team = Team.objects.create(league=league_min, name="HC Bulk")
+    start = _aware(2025, 9, 1, 19, 0)
+    TeamEvent.objects.bulk_create(
+        [TeamEvent(team=team, event_type="training", title="Bod", starts_at=start, ends_at=start)]
+    )
+    with pytest.raises(IntegrityError):
+        TeamEvent.objects.bulk_create(
+            [TeamEvent(team=team, event_type="training", title="Zpět", starts_at=start, ends_at=_aware(2025, 9, 1, 18, 0))]
+        )
+
+
 def test_related_game_requires_type_game(Team: Any, league_min: Any) -> None:
     """Require ``event_type='game'`` when ``related_game`` is set."""
     TeamEvent = apps.get_model("powerplay_app", "TeamEvent")
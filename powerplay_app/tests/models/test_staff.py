@@ -49,6 +49,15 @@ def test_staff_related_name_on_team(Team: Any, league_min: Any) -> None:
     assert s in team.staff_members.all()
 
 
+def test_staff_list_view_defers_long_columns(Team: Any, league_min: Any) -> None:
+    """``list_view()`` leaves ``role_description`` and ``address`` unloaded."""
+    Staff = apps.get_model("powerplay_app", "Staff")
+    team = _mk_team(Team, league_min)
+    Staff.objects.create(team=team, first_name="Jan", last_name="Dlouhý", role="Trenér", role_description="…")
+    member = Staff.objects.filter(team=team).list_view().get()
+    assert member.get_deferred_fields() == {"role_description", "address"}
+
+
 # --- Defaults & Required fields -------------------------------------------
 
 
@@ -90,3 +99,8 @@ def test_staff_phone_validator_accepts_valid_and_rejects_invalid(
     bad2 = Staff(team=team, first_name="Bad2", last_name="Phone2", role="Asistent", phone=long_number)
     with pytest.raises(ValidationError):
         bad2.full_clean()
+
+    # invalid: trailing newline (the pattern anchors the whole value)
+    bad3 = Staff(team=team, first_name="Bad3", last_name="Phone3", role="Asistent", phone="123456789\n")
+    with pytest.raises(ValidationError):
+        bad3.full_clean()
@@ -5,14 +5,17 @@ Coverage:
 * Proxy model meta flags and Czech verbose names.
 * Queryset access via proxy reads from the same table as ``Player``.
 * Creating and updating through the proxy persists on the base model.
+* ``with_season_totals`` aggregates per-game stats without row multiplication.
 """
 
 from __future__ import annotations
 
+import datetime as dt
 from typing import Any
 
 import pytest
 from django.apps import apps
+from django.utils import timezone
 
 pytestmark = pytest.mark.django_db
 
@@ -77,3 +80,35 @@ def test_proxy_can_create_and_updates_persist_on_player(
     p_proxy.save()
     p_base.refresh_from_db()
     assert p_base.last_name == "Totalsova"
+
+
+def test_with_season_totals_sums_stats_and_counts_nominations(
+    Player: Any, Team: Any, league_min: Any
+) -> None:
+    """Totals equal the per-game sums; GP counts nominated games once each."""
+    Game = apps.get_model("powerplay_app", "Game")
+    GameNomination = apps.get_model("powerplay_app", "GameNomination")
+    PlayerStats = apps.get_model("powerplay_app", "PlayerStats")
+    PlayerSeasonTotals = apps.get_model("powerplay_app", "PlayerSeasonTotals")
+
+    home = Team.objects.create(league=league_min, name="HC Totals H")
+    away = Team.objects.create(league=league_min, name="HC Totals A")
+    p = Player.objects.create(first_name="T", last_name="Sum", jersey_number=10, position="forward", team=home)
+    idle = Player.objects.create(first_name="I", last_name="Dle", jersey_number=11, position="forward", team=home)
+
+    tz = timezone.get_current_timezone()
+    for day, (g, a, pim) in enumerate([(2, 1, 2), (1, 0, 4)], start=1):
+        game = Game.objects.create(
+            starts_at=timezone.make_aware(dt.datetime(2025, 9, day, 18, 0), tz),
+            home_team=home,
+            away_team=away,
+            league=league_min,
+        )
+        GameNomination.objects.create(game=game, player=p, team=home)
+        PlayerStats.objects.create(player=p, game=game, goals=g, assists=a, penalty_minutes=pim)
+
+    rows = {r.pk: r for r in PlayerSeasonTotals.objects.filter(team=home).with_season_totals()}
+
+    assert (rows[p.pk].games_played, rows[p.pk].goals, rows[p.pk].assists) == (2, 3, 1)
+    assert (rows[p.pk].points, rows[p.pk].penalty_minutes, rows[p.pk].goals_against) == (4, 6, 0)
+    assert (rows[idle.pk].games_played, rows[idle.pk].points) == (0, 0)
@@ -118,3 +118,31 @@ def test_standings_points_and_sorting(Team: Any, league_min: Any) -> None:
     # Aggregation for penalty_minutes via PlayerStats is not required → expect 0
     assert isinstance(rows["HC A"]["penalty_minutes"], int)
     assert rows["HC A"]["penalty_minutes"] == 0
+
+
+def test_standings_penalty_minutes_and_constant_queries(
+    Team: Any, Player: Any, league_min: Any, django_assert_num_queries: Any
+) -> None:
+    """Merge per-team penalty minutes and keep the query count independent of teams."""
+    Tournament = apps.get_model("powerplay_app", "Tournament")
+    PlayerStats = apps.get_model("powerplay_app", "PlayerStats")
+    t = Tournament.objects.create(name="PIM Cup")
+
+    g1 = _mk_game(Team, league_min, "HC A", "HC B", _aware(2025, 9, 1, 10, 0), 1, 0)
+    g2 = _mk_game(Team, league_min, "HC C", "HC D", _aware(2025, 9, 2, 10, 0), 0, 0)
+    other = _mk_game(Team, league_min, "HC A", "HC C", _aware(2025, 9, 3, 10, 0), 5, 5)
+    t.games.add(g1, g2)
+
+    a = Team.objects.get(name="HC A")
+    p = Player.objects.create(first_name="Jan", last_name="Trest", jersey_number=7, team=a)
+    PlayerStats.objects.create(player=p, game=g1, penalty_minutes=4)
+    PlayerStats.objects.create(player=p, game=other, penalty_minutes=10)  # not in tournament
+
+    with django_assert_num_queries(3):
+        table = t.standings()
+
+    rows = {row["team"].name: row for row in table}
+    assert set(rows) == {"HC A", "HC B", "HC C", "HC D"}
+    assert rows["HC A"]["penalty_minutes"] == 4
+    assert rows["HC B"]["penalty_minutes"] == 0
+    assert rows["HC C"]["draws"] == rows["HC D"]["draws"] == 1
@@ -1,11 +1,12 @@
 # File: powerplay_app/tests/models/test_wallet.py
 """Tests for wallet models: categories and transactions.
 
-Covers two guarantees:
+Covers three guarantees:
 
 - ``WalletCategory`` names are unique **per team**.
 - ``WalletTransaction.signed_amount()`` returns ``+amount`` for incomes and
   ``-amount`` for expenses.
+- Saving or deleting a transaction drops the cached wallet year list.
 
 Docstrings and internal comments are English. Czech is kept in any user-facing
 strings when present (none here).
@@ -74,3 +75,24 @@ def test_wallet_transaction_signed_amount_income_expense(league_min: "League") -
 
     assert inc.signed_amount() == Decimal("123.45")
     assert exp.signed_amount() == Decimal("-50.00")
+
+
+def test_wallet_transaction_save_and_delete_drop_cached_years(league_min: "League") -> None:
+    """Saving or deleting a transaction invalidates the team's cached year list."""
+    from django.core.cache import cache
+
+    from powerplay_app.models.wallet import wallet_years_cache_key
+
+    WalletTransaction = apps.get_model("powerplay_app", "WalletTransaction")
+    t = _mk_team("HC Wallet Y", league_min)
+    key = wallet_years_cache_key(t.pk)
+
+    cache.set(key, [1999])
+    tx = WalletTransaction.objects.create(
+        team=t, kind="in", date=timezone.now().date(), amount=Decimal("10.00")
+    )
+    assert cache.get(key) is None
+
+    cache.set(key, [1999])
+    tx.delete()
+    assert cache.get(key) is None
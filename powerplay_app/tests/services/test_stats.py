@@ -0,0 +1,120 @@
+# file: powerplay_app/tests/services/test_stats.py
+"""Tests for per-game statistics recomputation.
+
+Coverage:
+* ``recompute_game`` derives goals, assists, points, PIM and goalie GA from the
+  game's events and the manual score, zeroing stale rows.
+* The recomputation runs a fixed number of queries regardless of how many
+  players are involved.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from typing import Any
+
+import pytest
+from django.apps import apps
+from django.utils import timezone
+
+from powerplay_app.models.games import GameCompetition, LineSlot
+from powerplay_app.services.stats import recompute_game
+
+pytestmark = pytest.mark.django_db
+
+
+def _mk_game() -> tuple[Any, Any, Any]:
+    """Create a league game with two teams and a 3:1 manual score.
+
+    Returns:
+        tuple[Any, Any, Any]: ``(game, home_team, away_team)``.
+    """
+    League = apps.get_model("powerplay_app", "League")
+    Team = apps.get_model("powerplay_app", "Team")
+    Game = apps.get_model("powerplay_app", "Game")
+    league = League.objects.create(
+        name="Stats League", season="2025/2026", date_start=dt.date(2025, 8, 1), date_end=dt.date(2026, 5, 1)
+    )
+    home = Team.objects.create(league=league, name="HC Stats H")
+    away = Team.objects.create(league=league, name="HC Stats A")
+    game = Game.objects.create(
+        starts_at=timezone.make_aware(dt.datetime(2025, 9, 12, 18, 0)),
+        home_team=home,
+        away_team=away,
+        competition=GameCompetition.LEAGUE,
+        league=league,
+        score_home=3,
+        score_away=1,
+    )
+    return game, home, away
+
+
+def _mk_player(team: Any, number: int, position: str = "forward") -> Any:
+    """Create a player with the given jersey number on ``team``."""
+    Player = apps.get_model("powerplay_app", "Player")
+    return Player.objects.create(
+        first_name="P", last_name=str(number), jersey_number=number, position=position, team=team
+    )
+
+
+def _stats(game: Any) -> dict[int, list[int]]:
+    """Return ``{player_id: [goals, assists, points, pim, ga]}`` for ``game``."""
+    PlayerStats = apps.get_model("powerplay_app", "PlayerStats")
+    return {
+        pid: rest
+        for pid, *rest in PlayerStats.objects.filter(game=game).values_list(
+            "player_id", "goals", "assists", "points", "penalty_minutes", "goals_against"
+        )
+    }
+
+
+def test_recompute_game_derives_stats_from_events() -> None:
+    """Goals, assists, points, PIM and goalie GA are rebuilt from the events."""
+    Goal = apps.get_model("powerplay_app", "Goal")
+    Penalty = apps.get_model("powerplay_app", "Penalty")
+    PlayerStats = apps.get_model("powerplay_app", "PlayerStats")
+    Line = apps.get_model("powerplay_app", "Line")
+    LineAssignment = apps.get_model("powerplay_app", "LineAssignment")
+
+    game, home, away = _mk_game()
+    scorer, a1, a2 = (_mk_player(home, n) for n in (9, 10, 11))
+    goalie = _mk_player(away, 30, position="goalie")
+    stale = _mk_player(away, 12)
+
+    Goal.objects.create(game=game, team=home, period=1, second_in_period=10, scorer=scorer, assist_1=a1, assist_2=a2)
+    Goal.objects.create(game=game, team=home, period=2, second_in_period=20, scorer=scorer, assist_1=a2)
+    Goal.objects.create(game=game, team=home, period=3, second_in_period=30, scorer=a1)
+    Penalty.objects.create(game=game, team=home, period=1, second_in_period=40, penalized_player=a1, minutes=2)
+    Penalty.objects.create(game=game, team=home, period=2, second_in_period=50, penalized_player=a1, minutes=5)
+    line = Line.objects.create(game=game, team=away, line_number=0)
+    LineAssignment.objects.create(line=line, slot=LineSlot.G, player=goalie)
+    PlayerStats.objects.create(game=game, player=stale, goals=4, assists=1, points=5)
+
+    recompute_game(game)
+
+    assert _stats(game) == {
+        scorer.id: [2, 0, 2, 0, 0],
+        a1.id: [1, 1, 2, 7, 0],
+        a2.id: [0, 2, 2, 0, 0],
+        goalie.id: [0, 0, 0, 0, 3],
+        stale.id: [0, 0, 0, 0, 0],
+    }
+
+
+def test_recompute_game_query_count_is_independent_of_players(django_assert_max_num_queries: Any) -> None:
+    """Recomputing a game with many scorers stays within a fixed query budget."""
+    Goal = apps.get_model("powerplay_app", "Goal")
+    PlayerStats = apps.get_model("powerplay_app", "PlayerStats")
+
+    game, home, _ = _mk_game()
+    players = [_mk_player(home, n) for n in range(1, 21)]
+    # Stale row first: once signals are connected, each goal recomputes the game.
+    PlayerStats.objects.create(game=game, player=players[0], goals=9, points=9)
+    for i, p in enumerate(players):
+        Goal.objects.create(game=game, team=home, period=1, second_in_period=i, scorer=p)
+
+    with django_assert_max_num_queries(10):
+        recompute_game(game)
+
+    assert all(row == [1, 0, 1, 0, 0] for row in _stats(game).values())
+    assert len(_stats(game)) == 20